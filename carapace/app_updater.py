@@ -41,16 +41,19 @@ class ApplicationUpdater:
             version_str = version_str[1:]
         return version.parse(version_str)
     
-    def get_latest_release(self) -> Optional[Dict[str, Any]]:
+    def get_latest_release(self, timeout: float = 10.0) -> Optional[Dict[str, Any]]:
         """
         Fetch the latest release information from GitHub
-        
+
+        Args:
+            timeout: Request timeout in seconds
+
         Returns:
             dict: Release information or None if failed
         """
         try:
             headers = {'Accept': 'application/vnd.github.v3+json'}
-            response = requests.get(self.LATEST_RELEASE_URL, headers=headers, timeout=10)
+            response = requests.get(self.LATEST_RELEASE_URL, headers=headers, timeout=timeout)
             response.raise_for_status()
             return response.json()
         except requests.exceptions.RequestException as e:
@@ -60,14 +63,17 @@ class ApplicationUpdater:
             logger.error(f"Invalid JSON in release response: {e}")
             return None
     
-    def check_for_updates(self) -> Tuple[bool, Optional[Dict[str, Any]]]:
+    def check_for_updates(self, timeout: float = 10.0) -> Tuple[bool, Optional[Dict[str, Any]]]:
         """
         Check if an application update is available
-        
+
+        Args:
+            timeout: Request timeout in seconds
+
         Returns:
             tuple: (update_available, release_info)
         """
-        release = self.get_latest_release()
+        release = self.get_latest_release(timeout=timeout)
         if not release:
             logger.info("Could not fetch release information")
             return False, None
@@ -254,14 +260,17 @@ del "%~f0"
             logger.error(f"Auto-update not implemented for {sys.platform}")
             return False
     
-    def check_and_notify(self) -> Optional[Dict[str, Any]]:
+    def check_and_notify(self, timeout: float = 10.0) -> Optional[Dict[str, Any]]:
         """
         Check for updates and return info for notification
-        
+
+        Args:
+            timeout: Request timeout in seconds
+
         Returns:
             dict: Update information if available, None otherwise
         """
-        update_available, release = self.check_for_updates()
+        update_available, release = self.check_for_updates(timeout=timeout)
         
         if not update_available or not release:
             return None
@@ -275,15 +284,18 @@ del "%~f0"
         }
 
 
-def check_for_app_updates() -> Optional[Dict[str, Any]]:
+def check_for_app_updates(timeout: float = 10.0) -> Optional[Dict[str, Any]]:
     """
     Convenience function to check for application updates
-    
+
+    Args:
+        timeout: Request timeout in seconds
+
     Returns:
         dict: Update information if available
     """
     updater = ApplicationUpdater()
-    return updater.check_and_notify()
+    return updater.check_and_notify(timeout=timeout)
 
 
 def perform_self_update() -> bool:
@@ -692,13 +692,13 @@ def update(
             table = Table(title=f"Available Updates ({len(updates)} addons)")
             table.add_column("Addon", style="cyan")
             table.add_column("Current Version", style="yellow")
-            table.add_column("Commits Behind", style="red")
-            
+            table.add_column("Status", style="red")
+
             for update in updates:
                 table.add_row(
                     update['name'],
                     update['current_version'],
-                    str(update['commits_behind'])
+                    "update available"
                 )
             
             console.print(table)
@@ -864,7 +864,8 @@ def update_db(
     
     # Check for updates
     console.print("[cyan]Checking for updates...[/cyan]")
-    update_available, remote_manifest = updater.check_for_updates()
+    # Explicit user command: bypass the check TTL
+    update_available, remote_manifest = updater.check_for_updates(force=True)
     
     if remote_manifest:
         console.print(f"[cyan]Remote database:[/cyan]")
@@ -898,7 +899,9 @@ def update_db(
                 import json
                 json.dump(remote_manifest, f, indent=2)
     else:
-        success = updater.update_database()
+        # The forced check above already touched the TTL marker, so the
+        # inner check must be forced too or it would no-op
+        success = updater.update_database(force=True)
     
     if success:
         console.print("[green]✓ Database updated successfully![/green]")
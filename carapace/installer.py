@@ -10,6 +10,7 @@ import shutil
 import tempfile
 import requests
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional, Dict, List, Tuple
 from datetime import datetime
@@ -18,6 +19,12 @@ import re
 import configparser
 import json
 
+try:
+    # CPython-internal but stable; creates junctions without a subprocess
+    import _winapi
+except ImportError:
+    _winapi = None
+
 from carapace.db import Database
 from carapace.paths import get_addon_path
 
@@ -468,7 +475,16 @@ class AddonInstaller:
             # Ensure parent directory exists
             target.parent.mkdir(parents=True, exist_ok=True)
             
-            # Windows: use junction for directories (doesn't require admin rights)
+            # Windows: use junction for directories (doesn't require admin rights).
+            # The in-process reparse-point call skips a CreateProcess per link
+            if _winapi is not None and hasattr(_winapi, 'CreateJunction'):
+                try:
+                    _winapi.CreateJunction(str(source), str(target))
+                    logger.info(f"Created junction: {target} -> {source}")
+                    return True
+                except OSError as e:
+                    logger.debug(f"In-process junction failed, falling back to mklink: {e}")
+
             result = subprocess.run(
                 ['cmd', '/c', 'mklink', '/J', str(target), str(source)],
                 capture_output=True,
@@ -494,6 +510,102 @@ class AddonInstaller:
         repos_path = self.addon_path / ".repos"
         repos_path.mkdir(exist_ok=True)
         return repos_path
+
+    def bulk_set_enabled(self, pairs: List[Tuple[str, bool]]) -> List[Tuple[str, int]]:
+        """Enable or disable a batch of addons with one cmd.exe process
+
+        Per-addon junction work costs a CreateProcess per rmdir/mklink;
+        feeding every command to a single cmd instance over stdin pays
+        that cost once for the whole batch. The enabled flags are then
+        flushed with a single CASE WHEN update in one transaction.
+
+        Returns:
+            The (name, enabled) pairs actually applied, so callers can
+            mirror exactly the flags the database now holds.
+        """
+        if not pairs:
+            return []
+
+        cursor = self.db.conn.cursor()
+        placeholders = ",".join("?" * len(pairs))
+        cursor.execute(f"""
+            SELECT name, path FROM installed
+            WHERE name IN ({placeholders}) AND deleted_at_utc IS NULL
+        """, [name for name, _ in pairs])
+        paths = {row['name']: Path(row['path']) for row in cursor.fetchall() if row['path']}
+
+        repos_path = self._get_repos_path()
+        commands = []
+        actions = []  # (name, enable, addon_path, repo_folder)
+
+        for name, enable in pairs:
+            addon_path = paths.get(name)
+            if addon_path is None:
+                continue
+
+            repo_folder = repos_path / addon_path.name
+            if enable:
+                if not repo_folder.exists():
+                    logger.error(f"Repository not found for {name} at {repo_folder}")
+                    continue
+                # Clear any leftover junction before re-linking
+                if addon_path.exists():
+                    commands.append(f'rmdir "{addon_path}"')
+                commands.append(f'mklink /J "{addon_path}" "{repo_folder}"')
+            else:
+                if os.path.islink(addon_path) or os.path.exists(addon_path):
+                    commands.append(f'rmdir "{addon_path}"')
+
+            actions.append((name, enable, addon_path, repo_folder))
+
+        if commands:
+            proc = subprocess.Popen(
+                ['cmd'],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                text=True
+            )
+            try:
+                _, stderr = proc.communicate("\n".join(commands) + "\nexit\n", timeout=60)
+                if proc.returncode != 0 and stderr:
+                    logger.error(f"Bulk junction commands reported errors: {stderr.strip()}")
+            except subprocess.TimeoutExpired:
+                proc.kill()
+                proc.communicate()
+                logger.error("Bulk junction commands timed out after 60s")
+
+        # Only flip flags for addons whose junction state actually
+        # matches the request; retry stragglers with the per-addon path
+        # so a single failed mklink/rmdir cannot desync the database
+        flags = []
+        for name, enable, addon_path, repo_folder in actions:
+            if enable and not addon_path.exists():
+                if not self._create_junction(repo_folder, addon_path):
+                    logger.error(f"Failed to enable {name}: junction not created")
+                    continue
+            elif not enable and addon_path.exists():
+                try:
+                    os.rmdir(addon_path)
+                except OSError as e:
+                    logger.error(f"Failed to disable {name}: {e}")
+                    continue
+            flags.append((name, 1 if enable else 0))
+
+        if flags:
+            # One CASE WHEN statement flips every flag in a single
+            # execution instead of one UPDATE per addon.
+            whens = " ".join("WHEN ? THEN ?" for _ in flags)
+            in_list = ",".join("?" * len(flags))
+            params = [v for pair in flags for v in pair]
+            params.extend(name for name, _ in flags)
+            with self.db.conn:
+                cursor.execute(f"""
+                    UPDATE installed SET enabled = CASE name {whens} END
+                    WHERE name IN ({in_list}) AND deleted_at_utc IS NULL
+                """, params)
+
+        return flags
     
     def _link_subfolders(self, repo_path: Path, addon_name: str) -> List[Tuple[str, Path]]:
         """
@@ -732,17 +844,26 @@ class AddonInstaller:
             if repo_folder.exists():
                 logger.info(f"Found Git repository at {repo_folder}")
                 
-                # Find and remove all junctions pointing to this repo
-                for item in self.addon_path.iterdir():
-                    if item.is_dir():
+                # Find and remove all junctions pointing to this repo.
+                # scandir gives us the reparse-point flag from the dirent and
+                # readlink resolves the junction target in a single syscall,
+                # unlike Path.resolve() which stats every path component.
+                repo_prefix = os.path.normcase(str(repo_folder))
+                with os.scandir(self.addon_path) as entries:
+                    for entry in entries:
+                        if not entry.is_dir(follow_symlinks=False):
+                            continue
                         try:
                             # Check if it's a junction
-                            if os.lstat(str(item)).st_file_attributes & stat.FILE_ATTRIBUTE_REPARSE_POINT:
+                            if entry.stat(follow_symlinks=False).st_file_attributes & stat.FILE_ATTRIBUTE_REPARSE_POINT:
                                 # Check if this junction points to our repo
-                                # For now, just remove junctions that match addon name or are in the repo
-                                if item.name == addon_name or str(repo_folder) in str(item.resolve()):
-                                    os.rmdir(str(item))  # Remove junction
-                                    logger.info(f"Removed junction: {item}")
+                                target = os.readlink(entry.path)
+                                # readlink reports junction targets with the \\?\ prefix
+                                if target.startswith('\\\\?\\'):
+                                    target = target[4:]
+                                if entry.name == addon_name or os.path.normcase(target).startswith(repo_prefix):
+                                    os.rmdir(entry.path)  # Remove junction
+                                    logger.info(f"Removed junction: {entry.path}")
                         except:
                             pass
                 
@@ -802,57 +923,66 @@ class AddonInstaller:
             logger.error(f"Failed to remove {addon_name}: {e}")
             return False
     
+    def _check_one_for_update(self, addon_info: Dict) -> Optional[Dict]:
+        """Compare one installed addon's HEAD against its remote"""
+        addon_path = Path(addon_info['path'])
+        if not addon_path.exists():
+            return None
+
+        # Check if it's a git repository
+        git_dir = addon_path / '.git'
+        if not git_dir.exists():
+            return None
+
+        try:
+            # Get current commit
+            result = subprocess.run(
+                ['git', 'rev-parse', 'HEAD'],
+                cwd=addon_path,
+                capture_output=True,
+                text=True
+            )
+            current_commit = result.stdout.strip()
+
+            # Ask the remote for its HEAD in a single round-trip.
+            # Unlike `git fetch`, ls-remote transfers no pack data.
+            result = subprocess.run(
+                ['git', 'ls-remote', 'origin', 'HEAD'],
+                cwd=addon_path,
+                capture_output=True,
+                text=True,
+                timeout=30
+            )
+
+            remote_commit = result.stdout[:40].strip()
+            if remote_commit and remote_commit != current_commit:
+                return {
+                    'name': addon_info['name'],
+                    'path': str(addon_path),
+                    'current_version': addon_info.get('version', 'unknown'),
+                    'needs_update': True
+                }
+
+        except Exception as e:
+            logger.debug(f"Could not check git status for {addon_info['name']}: {e}")
+
+        return None
+
     def check_for_updates(self) -> List[Dict]:
-        """Check all installed addons for updates using git"""
-        updates = []
+        """Check all installed addons for updates using git
+
+        Each check is a network round-trip to the addon's remote, so they
+        are overlapped with a bounded thread pool instead of run serially.
+        """
         installed = self.get_installed_addons()
-        
-        for addon_key, addon_info in installed.items():
-            addon_path = Path(addon_info['path'])
-            if not addon_path.exists():
-                continue
-            
-            # Check if it's a git repository
-            git_dir = addon_path / '.git'
-            if git_dir.exists():
-                try:
-                    # Get current commit
-                    result = subprocess.run(
-                        ['git', 'rev-parse', 'HEAD'],
-                        cwd=addon_path,
-                        capture_output=True,
-                        text=True
-                    )
-                    current_commit = result.stdout.strip()
-                    
-                    # Fetch to see if there are updates
-                    subprocess.run(
-                        ['git', 'fetch'],
-                        cwd=addon_path,
-                        capture_output=True
-                    )
-                    
-                    # Check if behind origin
-                    result = subprocess.run(
-                        ['git', 'rev-list', 'HEAD..origin/HEAD', '--count'],
-                        cwd=addon_path,
-                        capture_output=True,
-                        text=True
-                    )
-                    
-                    behind_count = int(result.stdout.strip() or 0)
-                    if behind_count > 0:
-                        updates.append({
-                            'name': addon_info['name'],
-                            'path': str(addon_path),
-                            'current_version': addon_info.get('version', 'unknown'),
-                            'commits_behind': behind_count
-                        })
-                        
-                except Exception as e:
-                    logger.debug(f"Could not check git status for {addon_info['name']}: {e}")
-        
-        return updates
+        if not installed:
+            return []
+
+        infos = list(installed.values())
+        with ThreadPoolExecutor(max_workers=min(8, len(infos))) as executor:
+            results = executor.map(self._check_one_for_update, infos)
+
+        return [r for r in results if r is not None]
     
     def update_addon(self, addon_name: str) -> bool:
         """Update an addon using git pull or reinstall"""
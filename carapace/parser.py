@@ -3,14 +3,86 @@ import requests
 from lxml import html, etree
 from typing import Dict, List, Set, Optional, Tuple
 from pathlib import Path
+from io import BytesIO
+from itertools import islice
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Keyword arguments for the streaming parser: libxml2 ingests raw bytes
+# directly, and since we never look elements up by id and ignore
+# comments/processing instructions, that bookkeeping is skipped too.
+_ITERPARSE_OPTS = dict(encoding='utf-8', collect_ids=False,
+                       remove_comments=True, remove_pis=True)
+
+# XPath expressions compiled once at import; lxml otherwise recompiles
+# each string on every xpath() call.
+_XP_LI = etree.XPath('.//li')
+_XP_LINKS = etree.XPath('.//a[@href]')
+_XP_TR = etree.XPath('.//tr')
+_XP_TD = etree.XPath('.//td')
+# C-level text concatenation; iterparse yields plain _Element objects
+# without the html text_content() convenience method
+_XP_STRING = etree.XPath('string()')
+
+# Section headers are underlined divs followed by the ul they introduce
+_SECTION_HEADERS = {
+    'We recommend that all players choose': ['recommended', 'featured'],
+    'Recommended Leveling Addons': ['recommended', 'leveling'],
+    'Recommended Endgame Addons': ['recommended', 'endgame'],
+}
+
+# SuperWoW headers are bold paragraphs followed by a table
+_TABLE_HEADERS = {
+    'Addons that require SuperWoW': ['superwow_required'],
+    'Addons that gain additional features with SuperWoW': ['superwow_features'],
+}
+
+# Known name variations that should be unified, keyed by the name
+# lowercased with spaces stripped and underscores dashed.
+# Note: For AtlasLoot, we keep the space version to match other Atlas mods
+_NAME_MAPPINGS = {
+    'atlasloot turtle': 'AtlasLoot Turtle',
+    'atlasloot-turtle': 'AtlasLoot Turtle',
+    'atlaslootturtlewow': 'AtlasLoot Turtle',
+    'pfquest turtle': 'pfQuest-turtle',
+    'pfquest-turtle': 'pfQuest-turtle',
+    'bigwigs turtle': 'BigWigs-Turtle',
+    'bigwigs-turtle': 'BigWigs-Turtle',
+    'questie turtle': 'Questie-Turtle',
+    'questie-turtle': 'Questie-Turtle',
+}
+
+# Separator (dash, colon or whitespace) plus description after the addon
+# name, with an optional trailing [marker]; one compiled alternation
+# replaces the three patterns previously rebuilt per call
+_DESC_SEP = re.compile(r'^(?:\s*[-–—]\s*|\s*:\s*|\s+)(.+?)(?:\s*\[[^\]]+\])?\s*$', re.DOTALL)
+
+# Special wiki markers like [Fu], [Img1], [Vid2] and bracketed annotations
+_MARKER_RE = re.compile(r'^\[?(?:Fu|Img\d+|[Vv]id\d+|Alt\d+|Screenshots?)\]?$', re.IGNORECASE)
+_BRACKET_RE = re.compile(r'\s*\[[^\]]+\]')
+
+# Hosts that count as addon repositories: github, gitlab, bitbucket and
+# other git services. One case-insensitive scan replaces a lower() copy
+# plus a substring test per host.
+_ADDON_HOST_RE = re.compile(
+    r'(?:github\.com|gitlab\.com|bitbucket\.org|shagu\.org|'
+    r'tempranova\.github\.io|woblight\.gitlab\.io)', re.IGNORECASE)
+
+
 class WikiParser:
-    def __init__(self):
+    def __init__(self, session: Optional[requests.Session] = None):
         self.wiki_url = "https://turtle-wow.fandom.com/wiki/Addons"
         self.addons: List[Dict] = []
+        # Lowercase name -> addon dict and normalized repo URL -> addon
+        # dict, kept in sync with self.addons so duplicates are merged at
+        # insert time instead of in a separate pass
+        self._by_name: Dict[str, Dict] = {}
+        self._by_repo: Dict[str, Dict] = {}
+        # Session keeps the HTTPS connection alive across repeat fetches;
+        # callers can pass a shared one to reuse its connection pool
+        self._session = session if session is not None else requests.Session()
+        self._session.headers.update({'User-Agent': 'Carapace Addon Manager/0.1'})
         self.tag_map = {
             'recommended': 'recommended',
             'featured': 'featured',
@@ -22,7 +94,8 @@ class WikiParser:
     
     def parse_from_file(self, filepath: Path) -> List[Dict]:
         """Parse addons from local HTML file"""
-        with open(filepath, 'r', encoding='utf-8') as f:
+        # Read in binary mode; the parser decodes in C
+        with open(filepath, 'rb') as f:
             content = f.read()
         return self._parse_html(content)
     
@@ -32,82 +105,143 @@ class WikiParser:
             url = self.wiki_url
         
         logger.info(f"Fetching wiki page from: {url}")
-        response = requests.get(url, headers={'User-Agent': 'Carapace Addon Manager/0.1'})
+        response = self._session.get(url, timeout=30)
         response.raise_for_status()
-        return self._parse_html(response.text)
-    
-    def _parse_html(self, html_content: str) -> List[Dict]:
-        """Main parsing logic"""
-        tree = html.fromstring(html_content)
+        # Pass the raw bytes through; decoding to str here would only be
+        # undone again inside libxml2
+        return self._parse_html(response.content)
+
+    def _parse_html(self, html_content) -> List[Dict]:
+        """Main parsing logic; accepts the page as bytes or str"""
+        if isinstance(html_content, str):
+            html_content = html_content.encode('utf-8')
         self.addons = []
-        
-        # Parse recommended sections
-        self._parse_recommended_sections(tree)
-        
-        # Parse the full addons list (alphabetical)
-        self._parse_full_addons_list(tree)
-        
-        # Parse SuperWoW special tables
-        self._parse_superwow_tables(tree)
-        
-        # Apply parsing quirks to fix wiki inconsistencies
+        self._by_name = {}
+        self._by_repo = {}
+
+        # One streaming pass dispatches the recommended sections, the
+        # full alphabetical list and the SuperWoW tables, releasing each
+        # section's subtree as soon as it has been consumed
+        self._parse_stream(BytesIO(html_content))
+
+        # Apply parsing quirks to fix wiki inconsistencies; deduplication
+        # already happened at insert time in _add_or_merge
         self._apply_parsing_quirks()
-        
-        # Deduplicate addons by name and repo URL while preserving tags
-        self._deduplicate_addons()
-        
+
+        # Tags are kept as sets internally; emit them as sorted lists so
+        # downstream consumers see a stable order
+        for addon in self.addons:
+            addon['tags'] = sorted(addon['tags'])
+
         logger.info(f"Parsed {len(self.addons)} unique addons")
         return self.addons
     
-    def _parse_recommended_sections(self, tree):
-        """Parse the recommended addon sections"""
-        content = tree.xpath('//div[@class="mw-parser-output"]')[0] if tree.xpath('//div[@class="mw-parser-output"]') else tree
-        if content is None:
-            return
-        
-        # Find "We recommend that all players choose one of these:" section
-        # This text appears in a div with underline styling
-        elements = content.xpath('.//div[contains(., "We recommend that all players choose")]')
-        if elements:
-            # Find the next ul element
-            for elem in elements:
-                next_ul = elem.getnext()
-                if next_ul is not None and next_ul.tag == 'ul':
-                    self._parse_recommended_list(next_ul, ['recommended', 'featured'])
-        
-        # Find "Recommended Leveling Addons:" section
-        elements = content.xpath('.//div[contains(., "Recommended Leveling Addons")]')
-        if elements:
-            for elem in elements:
-                next_ul = elem.getnext()
-                if next_ul is not None and next_ul.tag == 'ul':
-                    self._parse_recommended_list(next_ul, ['recommended', 'leveling'])
-        
-        # Find "Recommended Endgame Addons:" section  
-        elements = content.xpath('.//div[contains(., "Recommended Endgame Addons")]')
-        if elements:
-            for elem in elements:
-                next_ul = elem.getnext()
-                if next_ul is not None and next_ul.tag == 'ul':
-                    self._parse_recommended_list(next_ul, ['recommended', 'endgame'])
+    @staticmethod
+    def _header_text(elem) -> str:
+        """Cheap header text: first few text chunks, not the whole subtree"""
+        # Header text is often a direct child, so try elem.text before
+        # touching the subtree at all
+        text = (elem.text or '').strip()
+        if text:
+            return text
+        return ''.join(islice(elem.itertext(), 4)).strip()
+
+    def _parse_stream(self, source):
+        """Dispatch all wiki sections while the tree is being built
+
+        iterparse fires end events in document order, so a header element
+        closes before the list or table it introduces. A matched header is
+        remembered and the following sibling dispatched when it arrives
+        (``getprevious() is header`` mirrors the wiki's header-then-list
+        layout). Consumed lists and tables are cleared along with any
+        elements before them, keeping peak memory bounded by a section
+        rather than the whole page.
+        """
+        pending_header = None   # matched header awaiting its list/table
+        pending_kind = None     # 'ul' or 'table'
+        pending_tags = None
+        in_full_list = False
+        full_list_parent = None
+
+        for _event, elem in etree.iterparse(
+                source, events=('end',), html=True,
+                tag=('div', 'p', 'h2', 'h3', 'ul', 'table'),
+                **_ITERPARSE_OPTS):
+            tag = elem.tag
+            consumed = False
+
+            if tag == 'ul':
+                if (pending_kind == 'ul' and pending_header is not None
+                        and elem.getprevious() is pending_header):
+                    self._parse_recommended_list(elem, pending_tags)
+                    pending_header = None
+                    consumed = True
+                # Only top-level lists belong to the alphabetical section;
+                # nested uls are part of their enclosing list item
+                elif in_full_list and elem.getparent() is full_list_parent:
+                    self._parse_addon_list(elem)
+                    consumed = True
+            elif tag == 'table':
+                if (pending_kind == 'table' and pending_header is not None
+                        and elem.getprevious() is pending_header):
+                    self._parse_table(elem, pending_tags)
+                    pending_header = None
+                    consumed = True
+            elif tag == 'div':
+                text = self._header_text(elem)
+                for needle, tags in _SECTION_HEADERS.items():
+                    if text.startswith(needle):
+                        pending_header = elem
+                        pending_kind = 'ul'
+                        pending_tags = tags
+                        break
+            elif tag == 'p':
+                text = self._header_text(elem)
+                for needle, tags in _TABLE_HEADERS.items():
+                    if text.startswith(needle):
+                        # The SuperWoW tables also terminate the full list
+                        in_full_list = False
+                        pending_header = elem
+                        pending_kind = 'table'
+                        pending_tags = tags
+                        break
+            elif tag == 'h3':
+                for child in elem:
+                    if child.tag == 'span' and child.get('id') == 'Full_Addons_List':
+                        in_full_list = True
+                        full_list_parent = elem.getparent()
+                        break
+            elif tag == 'h2':
+                if in_full_list and 'Further Addons Collections' in self._header_text(elem):
+                    in_full_list = False
+
+            if consumed:
+                # Drop the consumed subtree and everything parsed before
+                # it within the same parent
+                parent = elem.getparent()
+                elem.clear()
+                if parent is not None:
+                    while elem.getprevious() is not None:
+                        del parent[0]
     
     def _parse_recommended_list(self, element, tags: List[str]):
         """Parse a recommended addon list (ul element)"""
         if element is None or element.tag != 'ul':
             return
         
-        for li in element.xpath('.//li'):
+        for li in _XP_LI(element):
             # Skip empty list items
             if li.get('class') == 'mw-empty-elt':
                 continue
-                
-            # Get all text and links from the list item
-            text_content = ''.join(li.itertext()).strip()
-            links = li.xpath('.//a[@href]')
-            
+
+            # Get all text and links from the list item; the text is
+            # computed once and reused for every link below
+            text_content = _XP_STRING(li).strip()
+            links = _XP_LINKS(li)
+
             for link in links:
                 href = link.get('href')
-                addon_name = link.text_content().strip()
+                addon_name = _XP_STRING(link).strip()
                 
                 # Skip special markers and non-addon links
                 if self._is_special_marker(addon_name):
@@ -126,91 +260,62 @@ class WikiParser:
                         url = 'https://turtle-wow.fandom.com' + href
                     
                     # Extract description from the parent text
-                    parent_text = ''.join(li.itertext()).strip()
-                    description = self._extract_description(parent_text, addon_name)
-                    
-                    addon = {
-                        'name': addon_name,
-                        'repo_url': url,  # Store ANY URL
-                        'description': description,
-                        'tags': tags.copy()
-                    }
-                    self.addons.append(addon)
-    
-    def _parse_full_addons_list(self, tree):
-        """Parse the main alphabetical addons list"""
-        # Find the "Full Addons List" section
-        full_list_header = tree.xpath('//h3[span[@id="Full_Addons_List"]]')
-        if not full_list_header:
-            return
-        
-        # Iterate through siblings after the header until we hit the SuperWoW or unsupported sections
-        current = full_list_header[0].getnext() if full_list_header else None
-        
-        while current is not None:
-            # Stop if we hit the SuperWoW sections
-            if current.tag == 'p' and 'Addons that require SuperWoW' in ''.join(current.itertext()):
-                break
-            if current.tag == 'p' and 'Addons that gain additional features' in ''.join(current.itertext()):
-                break
-            # Stop if we hit the "Further Addons Collections" section (unsupported)
-            if current.tag == 'h2':
-                header_text = ''.join(current.itertext())
-                if 'Further Addons Collections' in header_text:
-                    break
-            
-            # Parse alphabetical sections (A, B, C, etc.)
-            if current.tag == 'h3':
-                # This is a letter header, get the next ul element
-                next_elem = current.getnext()
-                if next_elem is not None and next_elem.tag == 'ul':
-                    self._parse_addon_list(next_elem)
-            elif current.tag == 'ul':
-                # Direct list under Full Addons List
-                self._parse_addon_list(current)
-            
-            current = current.getnext()
+                    description = self._extract_description(text_content, addon_name)
+
+                    # Store ANY URL
+                    self._add_or_merge(addon_name, url, description, set(tags))
     
     def _parse_addon_list(self, ul_element):
         """Parse a ul element containing addon links"""
-        for li in ul_element.xpath('.//li'):
-            text_content = ''.join(li.itertext()).strip()
-            links = li.xpath('.//a[@href]')
-            
-            if not links:
+        for li in _XP_LI(ul_element):
+            text_content = _XP_STRING(li).strip()
+
+            # Iterate links lazily; most items resolve after one or two
+            # anchors, so there is no point materializing the full list
+            link_iter = li.iter('a')
+
+            # Get the first link with an href (should be the addon name)
+            first_link = None
+            for link in link_iter:
+                if link.get('href'):
+                    first_link = link
+                    break
+            if first_link is None:
                 continue
-                
-            # Get the first link (should be the addon name)
-            first_link = links[0]
-            addon_name = first_link.text_content().strip()
-            
+
+            addon_name = _XP_STRING(first_link).strip()
+
             # Skip if it's a special marker
             if self._is_special_marker(addon_name):
                 continue
-            
+
             # Find ANY URL - store whatever we have
             addon_url = None
-            
+            first_href = first_link.get('href')
+
             # First, try to find a proper repo URL (GitHub, GitLab, etc)
-            for link in links:
-                href = link.get('href')
-                if self._is_addon_url(href):
-                    addon_url = href
-                    break
-            
+            if self._is_addon_url(first_href):
+                addon_url = first_href
+            else:
+                for link in link_iter:
+                    href = link.get('href')
+                    if href and self._is_addon_url(href):
+                        addon_url = href
+                        break
+
             # If no repo URL found, store WHATEVER URL we have from the first link
             if not addon_url:
-                first_href = first_link.get('href', '')
-                if first_href:
-                    # Convert relative wiki URLs to absolute
-                    if first_href.startswith('/wiki/'):
-                        addon_url = 'https://turtle-wow.fandom.com' + first_href
-                    else:
-                        addon_url = first_href
-                
+                # Convert relative wiki URLs to absolute
+                if first_href.startswith('/wiki/'):
+                    addon_url = 'https://turtle-wow.fandom.com' + first_href
+                else:
+                    addon_url = first_href
+
                 # Still check [Fu] or other links for better URLs
-                for link in links[1:]:
-                    link_text = link.text_content().strip()
+                for link in li.iter('a'):
+                    if link is first_link:
+                        continue
+                    link_text = _XP_STRING(link).strip()
                     if link_text.startswith('[') and link_text.endswith(']'):
                         href = link.get('href')
                         if href and self._is_addon_url(href):
@@ -219,161 +324,132 @@ class WikiParser:
             
             # Extract description and tags from the full text
             description, extracted_tags = self._parse_addon_text(text_content, addon_name)
-            
-            addon = {
-                'name': addon_name,
-                'repo_url': addon_url if addon_url else '',
-                'description': description,
-                'tags': extracted_tags
-            }
-            self.addons.append(addon)
-    
-    def _parse_superwow_tables(self, tree):
-        """Parse the SuperWoW requirement tables"""
-        # Find "Addons that require SuperWoW" - it's in a <p> tag followed by a table
-        paragraphs = tree.xpath('//p[b[contains(text(), "Addons that require SuperWoW")]]')
-        if paragraphs:
-            for p in paragraphs:
-                table = p.getnext()
-                if table is not None and table.tag == 'table':
-                    self._parse_table(table, ['superwow_required'])
-        
-        # Find "Addons that gain additional features with SuperWoW" 
-        paragraphs = tree.xpath('//p[b[contains(text(), "Addons that gain additional features with SuperWoW")]]')
-        if paragraphs:
-            for p in paragraphs:
-                table = p.getnext()
-                if table is not None and table.tag == 'table':
-                    self._parse_table(table, ['superwow_features'])
+
+            self._add_or_merge(addon_name, addon_url or '', description, extracted_tags)
     
     def _parse_table(self, table_element, tags: List[str]):
         """Parse a table of addons"""
-        for row in table_element.xpath('.//tr'):
-            cells = row.xpath('.//td')
+        for row in _XP_TR(table_element):
+            cells = _XP_TD(row)
             if len(cells) >= 2:
                 # First cell contains the addon link
-                link = cells[0].xpath('.//a[@href]')
+                link = _XP_LINKS(cells[0])
                 if link:
                     href = link[0].get('href')
-                    addon_name = link[0].text_content().strip()
+                    addon_name = _XP_STRING(link[0]).strip()
                     
                     # For SuperWoW features table, description might be in 3rd column
                     if 'superwow_features' in tags and len(cells) >= 3:
-                        description = cells[2].text_content().strip()
+                        description = _XP_STRING(cells[2]).strip()
                     else:
                         # Second cell contains the description
-                        description = cells[1].text_content().strip()
+                        description = _XP_STRING(cells[1]).strip()
                     
-                    # Check if this addon already exists and update tags
-                    existing = self._find_addon(addon_name)
-                    if existing:
-                        for tag in tags:
-                            if tag not in existing['tags']:
-                                existing['tags'].append(tag)
-                    else:
-                        # Store ANY URL, not just repo URLs
-                        url = href
-                        if not self._is_addon_url(href):
-                            # Convert relative URLs to absolute
-                            if href.startswith('/wiki/'):
-                                url = 'https://turtle-wow.fandom.com' + href
-                        
-                        addon = {
-                            'name': addon_name,
-                            'repo_url': url if url else '',
-                            'description': description,
-                            'tags': tags.copy()
-                        }
-                        self.addons.append(addon)
+                    # Store ANY URL, not just repo URLs
+                    url = href
+                    if not self._is_addon_url(href):
+                        # Convert relative URLs to absolute
+                        if href.startswith('/wiki/'):
+                            url = 'https://turtle-wow.fandom.com' + href
+
+                    self._add_or_merge(addon_name, url or '', description, set(tags))
     
-    def _parse_addon_text(self, full_text: str, addon_name: str) -> Tuple[str, List[str]]:
+    def _parse_addon_text(self, full_text: str, addon_name: str) -> Tuple[str, Set[str]]:
         """Extract description and tags from addon text"""
-        tags = []
-        
+        tags = set()
+
         # Check for special indicators in brackets
         if '[SuperWoW]' in full_text or '[SuperWOW]' in full_text:
-            tags.append('superwow_features')
+            tags.add('superwow_features')
         
         # Extract description (text after the dash or colon)
         description = self._extract_description(full_text, addon_name)
         
         # Remove special markers from description
-        description = re.sub(r'\s*\[[^\]]+\]', '', description)
-        description = description.strip()
+        description = _BRACKET_RE.sub('', description).strip()
         
         return description, tags
     
     def _extract_description(self, full_text: str, addon_name: str) -> str:
         """Extract description from full text"""
         # Try to find description after dash or colon
-        patterns = [
-            rf'{re.escape(addon_name)}\s*[-–—]\s*(.+)',
-            rf'{re.escape(addon_name)}\s*:\s*(.+)',
-            rf'{re.escape(addon_name)}\s+(.+)'
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, full_text, re.IGNORECASE)
+        if full_text.lower().startswith(addon_name.lower()):
+            match = _DESC_SEP.match(full_text[len(addon_name):])
             if match:
-                description = match.group(1).strip()
-                # Remove trailing special markers
-                description = re.sub(r'\s*\[[^\]]+\]$', '', description)
-                return description
-        
+                return match.group(1).strip()
+
         # If no pattern matches, return cleaned text
         cleaned = full_text.replace(addon_name, '', 1).strip()
-        cleaned = re.sub(r'\s*\[[^\]]+\]', '', cleaned)
+        cleaned = _BRACKET_RE.sub('', cleaned)
         return cleaned.strip(' -:')
     
     def _is_addon_url(self, url: str) -> bool:
         """Check if URL is a valid addon repository URL"""
-        if not url:
-            return False
-        # Include github, gitlab, bitbucket, and other git services
-        valid_hosts = ['github.com', 'gitlab.com', 'bitbucket.org', 'shagu.org', 'tempranova.github.io', 'woblight.gitlab.io']
-        return any(host in url.lower() for host in valid_hosts)
+        return bool(url) and _ADDON_HOST_RE.search(url) is not None
     
     def _is_special_marker(self, text: str) -> bool:
         """Check if text is a special marker like [Fu], [Img1], etc."""
-        markers = [r'^\[?(?:Fu|Img\d+|vid\d+|Vid\d+|Alt\d+|Screenshots?)\]?$']
-        for marker in markers:
-            if re.match(marker, text, re.IGNORECASE):
-                return True
-        return False
+        return bool(_MARKER_RE.match(text))
     
-    def _find_addon(self, name: str) -> Optional[Dict]:
-        """Find an addon by name in the current list"""
-        for addon in self.addons:
-            if addon['name'].lower() == name.lower():
-                return addon
-        return None
+    @staticmethod
+    def _canonical_name(name: str) -> str:
+        """Unify known wiki name variations (see _NAME_MAPPINGS)"""
+        key = name.lower().replace(' ', '').replace('_', '-')
+        return _NAME_MAPPINGS.get(key, name)
+
+    def _add_or_merge(self, name: str, repo_url: str, description: str,
+                      tags: Set[str]) -> Dict:
+        """Insert a parsed addon, merging into an existing entry if the
+        name or repository URL was already seen
+
+        Merging at insert time replaces the old post-parse dedup pass:
+        tags are unioned, the longest description wins, a missing repo
+        URL is filled in, and dashed names are preferred over spaced
+        ones when two entries share a repository.
+        """
+        name = self._canonical_name(name)
+        repo_key = repo_url.lower().rstrip('/') if repo_url else ''
+
+        existing = self._by_name.get(name.lower())
+        if existing is None and repo_key:
+            existing = self._by_repo.get(repo_key)
+
+        if existing is not None:
+            # Prefer names with dashes over spaces
+            if '-' in name and '-' not in existing['name']:
+                self._by_name.pop(existing['name'].lower(), None)
+                existing['name'] = name
+            # Alias this name to the merged entry so later occurrences
+            # under either name keep landing on it
+            self._by_name.setdefault(name.lower(), existing)
+            existing['tags'] |= tags
+            # Take longest description
+            if len(description or '') > len(existing.get('description', '')):
+                existing['description'] = description
+            if repo_url and not existing.get('repo_url'):
+                existing['repo_url'] = repo_url
+            if repo_key:
+                self._by_repo.setdefault(repo_key, existing)
+            return existing
+
+        addon = {
+            'name': name,
+            'repo_url': repo_url or '',
+            'description': description,
+            'tags': set(tags)
+        }
+        self.addons.append(addon)
+        self._by_name[name.lower()] = addon
+        if repo_key:
+            self._by_repo[repo_key] = addon
+        return addon
     
     def _apply_parsing_quirks(self):
         """Fix known wiki inconsistencies and quirks
-        
-        This function handles edge cases where the wiki has duplicate or
-        inconsistent entries that shouldn't be treated as separate addons.
+
+        Name variations are unified by _canonical_name at insert time;
+        this pass only normalizes known broken repository URLs.
         """
-        # Known name variations that should be unified
-        # Note: For AtlasLoot, we keep the space version to match other Atlas mods
-        name_mappings = {
-            'atlasloot turtle': 'AtlasLoot Turtle',
-            'atlasloot-turtle': 'AtlasLoot Turtle',
-            'atlaslootturtlewow': 'AtlasLoot Turtle',
-            'pfquest turtle': 'pfQuest-turtle',
-            'pfquest-turtle': 'pfQuest-turtle',
-            'bigwigs turtle': 'BigWigs-Turtle',
-            'bigwigs-turtle': 'BigWigs-Turtle',
-            'questie turtle': 'Questie-Turtle',
-            'questie-turtle': 'Questie-Turtle',
-        }
-        
-        # Normalize addon names
-        for addon in self.addons:
-            name_lower = addon['name'].lower().replace(' ', '').replace('_', '-')
-            if name_lower in name_mappings:
-                addon['name'] = name_mappings[name_lower]
-        
         # Known broken/duplicate URLs to fix
         url_fixes = {
             'https://github.com/Lexiebean/AtlasLoot': 'https://github.com/Lexiebean/AtlasLoot',
@@ -388,65 +464,3 @@ class WikiParser:
                     if url == bad_url.lower():
                         addon['repo_url'] = good_url
                         break
-    
-    def _deduplicate_addons(self):
-        """Deduplicate addons by name AND repo URL, merging tags and data"""
-        # First pass: group by repo URL
-        by_repo = {}
-        no_repo = []
-        
-        for addon in self.addons:
-            repo_url = addon.get('repo_url', '').lower().rstrip('/')
-            if repo_url:
-                if repo_url not in by_repo:
-                    by_repo[repo_url] = []
-                by_repo[repo_url].append(addon)
-            else:
-                no_repo.append(addon)
-        
-        # Merge addons with same repo URL
-        merged = []
-        for repo_url, addon_list in by_repo.items():
-            if len(addon_list) == 1:
-                merged.append(addon_list[0])
-            else:
-                # Merge multiple addons with same repo
-                base = addon_list[0].copy()
-                
-                # Prefer the name with more specific formatting
-                for addon in addon_list[1:]:
-                    # Prefer names with dashes over spaces
-                    if '-' in addon['name'] and '-' not in base['name']:
-                        base['name'] = addon['name']
-                    # Merge tags
-                    for tag in addon.get('tags', []):
-                        if tag not in base['tags']:
-                            base['tags'].append(tag)
-                    # Take longest description
-                    if len(addon.get('description', '')) > len(base.get('description', '')):
-                        base['description'] = addon['description']
-                    # Merge any other useful data
-                    if not base.get('homepage_url') and addon.get('homepage_url'):
-                        base['homepage_url'] = addon['homepage_url']
-                
-                logger.info(f"Merged {len(addon_list)} entries for {base['name']} (same repo: {repo_url})")
-                merged.append(base)
-        
-        # Second pass: deduplicate by name for addons without repo URLs
-        seen_names = {addon['name'].lower(): addon for addon in merged}
-        
-        for addon in no_repo:
-            name_lower = addon['name'].lower()
-            if name_lower in seen_names:
-                # Merge with existing
-                existing = seen_names[name_lower]
-                for tag in addon.get('tags', []):
-                    if tag not in existing['tags']:
-                        existing['tags'].append(tag)
-                if len(addon.get('description', '')) > len(existing.get('description', '')):
-                    existing['description'] = addon['description']
-            else:
-                seen_names[name_lower] = addon
-                merged.append(addon)
-        
-        self.addons = merged
\ No newline at end of file
@@ -5,12 +5,52 @@ Path detection and management for TurtleWoW installation
 import os
 import sys
 import winreg
+import functools
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional, List
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Executables that identify a TurtleWoW installation (case-insensitive)
+_WOW_EXES = {"turtlewow.exe", "turtle wow.exe", "wow.exe"}
+
+# Common install locations, built once at import so expanduser (which
+# reads the environment) doesn't run on every detection attempt. The
+# drive-letter paths are only worth probing on Windows.
+_HOME = Path(os.path.expanduser("~"))
+_COMMON_WOW_PATHS = (
+    Path("C:/TurtleWoW"),
+    Path("C:/Program Files/TurtleWoW"),
+    Path("C:/Program Files (x86)/TurtleWoW"),
+    Path("D:/TurtleWoW"),
+    Path("D:/Games/TurtleWoW"),
+) if sys.platform == 'win32' else ()
+_COMMON_WOW_PATHS += (
+    _HOME / "TurtleWoW",
+    _HOME / "Games" / "TurtleWoW",
+    _HOME / "Desktop" / "TurtleWoW",
+)
+
+
+@functools.lru_cache(maxsize=64)
+def _validate_impl(path_str: str) -> bool:
+    """Cached check that a directory holds a TurtleWoW installation
+
+    Candidate directories are probed repeatedly during detection, so the
+    result is memoized. A single scandir reads the directory once and
+    compares entry names against the exe set, instead of one stat per
+    candidate exe name; scandir also reports is_file() from the cached
+    directory entry on most platforms.
+    """
+    try:
+        with os.scandir(path_str) as entries:
+            return any(entry.name.lower() in _WOW_EXES and entry.is_file()
+                       for entry in entries)
+    except OSError:
+        return False
+
 class PathDetector:
     """Detect and manage TurtleWoW installation paths"""
     
@@ -52,72 +92,76 @@ class PathDetector:
     
     def detect_from_common_locations(self) -> Optional[Path]:
         """Check common installation locations for TurtleWoW"""
-        common_paths = [
-            Path("C:/TurtleWoW"),
-            Path("C:/Program Files/TurtleWoW"),
-            Path("C:/Program Files (x86)/TurtleWoW"),
-            Path("D:/TurtleWoW"),
-            Path("D:/Games/TurtleWoW"),
-            Path(os.path.expanduser("~/TurtleWoW")),
-            Path(os.path.expanduser("~/Games/TurtleWoW")),
-            Path(os.path.expanduser("~/Desktop/TurtleWoW")),
-        ]
-        
-        for path in common_paths:
-            if self._validate_wow_directory(path):
+        # Fast path: the default install location, probed synchronously so
+        # the warm case never pays thread-pool startup
+        first = _COMMON_WOW_PATHS[0]
+        if self._validate_wow_directory(first):
+            logger.info(f"Found TurtleWoW at common location: {first}")
+            return first
+
+        # The remaining probes are independent filesystem round-trips
+        # (possibly against spun-down drives), so overlap their I/O;
+        # results are still checked in priority order
+        rest = _COMMON_WOW_PATHS[1:]
+        with ThreadPoolExecutor(max_workers=len(rest)) as executor:
+            results = list(executor.map(_validate_impl, (str(p) for p in rest)))
+
+        for path, valid in zip(rest, results):
+            if valid:
                 logger.info(f"Found TurtleWoW at common location: {path}")
                 return path
-        
+
         return None
     
     def detect_from_desktop_shortcuts(self) -> List[Path]:
         """Scan desktop shortcuts for TurtleWoW.exe references"""
         potential_paths = []
-        
+
         if sys.platform != 'win32':
             return potential_paths
-        
+
         try:
-            import winshell
-            desktop = Path(winshell.desktop())
-            
-            for lnk_file in desktop.glob("*.lnk"):
-                try:
-                    shortcut = winshell.shortcut(str(lnk_file))
-                    target = shortcut.path
-                    if target and "turtlewow" in target.lower():
-                        target_path = Path(target).parent
-                        if self._validate_wow_directory(target_path):
-                            potential_paths.append(target_path)
-                            logger.debug(f"Found via shortcut {lnk_file.name}: {target_path}")
-                except:
-                    continue
+            import pythoncom
+            from win32com.shell import shell, shellcon
         except ImportError:
-            logger.debug("winshell not available for shortcut scanning")
+            logger.debug("pywin32 not available for shortcut scanning")
+            return potential_paths
+
+        try:
+            desktop = Path(shell.SHGetFolderPath(0, shellcon.CSIDL_DESKTOP, 0, 0))
+
+            # One IShellLink instance is loaded with each .lnk in turn,
+            # instead of spinning up a COM dispatch per shortcut
+            pythoncom.CoInitialize()
+            try:
+                link = pythoncom.CoCreateInstance(
+                    shell.CLSID_ShellLink, None,
+                    pythoncom.CLSCTX_INPROC_SERVER, shell.IID_IShellLink)
+                persist = link.QueryInterface(pythoncom.IID_IPersistFile)
+
+                for lnk_file in desktop.glob("*.lnk"):
+                    try:
+                        persist.Load(str(lnk_file))
+                        target = link.GetPath(shell.SLGP_RAWPATH)[0]
+                        if target and "turtlewow" in target.lower():
+                            target_path = Path(target).parent
+                            if self._validate_wow_directory(target_path):
+                                potential_paths.append(target_path)
+                                logger.debug(f"Found via shortcut {lnk_file.name}: {target_path}")
+                    except:
+                        continue
+            finally:
+                pythoncom.CoUninitialize()
         except Exception as e:
             logger.error(f"Error scanning shortcuts: {e}")
-        
+
         return potential_paths
     
     def _validate_wow_directory(self, path: Path) -> bool:
         """Validate that a directory contains TurtleWoW installation"""
-        if not path or not path.exists():
+        if not path:
             return False
-        
-        # Check for TurtleWoW.exe (case-insensitive on Windows)
-        exe_files = [
-            "TurtleWoW.exe",
-            "turtlewow.exe",
-            "Turtle WoW.exe",
-            "WoW.exe"
-        ]
-        
-        for exe_name in exe_files:
-            exe_path = path / exe_name
-            if exe_path.exists() and exe_path.is_file():
-                return True
-        
-        return False
+        return _validate_impl(str(path))
     
     def detect_wow_path(self) -> Optional[Path]:
         """
@@ -126,6 +170,11 @@ class PathDetector:
         2. Check common installation locations
         3. Scan desktop shortcuts
         """
+        # Return the memoized result; the full cascade can cost hundreds
+        # of syscalls when these getters run once per addon
+        if self.wow_path is not None:
+            return self.wow_path
+
         # Try registry first (most reliable)
         path = self.detect_from_registry()
         if path:
@@ -147,7 +196,13 @@ class PathDetector:
         
         logger.warning("Could not auto-detect TurtleWoW installation")
         return None
-    
+
+    def invalidate(self):
+        """Forget detected paths so the next lookup re-runs detection"""
+        self.wow_path = None
+        self.addon_path = None
+        _validate_impl.cache_clear()
+
     def ensure_addon_directory(self, wow_path: Optional[Path] = None) -> Optional[Path]:
         r"""
         Ensure the Interface\AddOns directory exists
@@ -230,4 +285,8 @@ def ensure_addon_directory() -> Optional[Path]:
 
 def set_wow_path(path: Path) -> bool:
     """Set the WoW installation path manually"""
-    return _detector.set_wow_path(path)
\ No newline at end of file
+    return _detector.set_wow_path(path)
+
+def invalidate_paths():
+    """Drop cached detection results (e.g. after the game was moved)"""
+    _detector.invalidate()
\ No newline at end of file
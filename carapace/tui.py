@@ -3,39 +3,57 @@ Terminal User Interface for Carapace using Textual
 """
 
 import os
+import re
 import logging
 from datetime import datetime
 
 # Debug flag - set to False for production builds
 DEBUG_ENABLED = os.environ.get('CARAPACE_DEBUG', 'false').lower() == 'true'
 
-if DEBUG_ENABLED:
-    # Set up debug logging to file ONLY - no console output
+
+def _setup_debug_logging() -> None:
+    """Set up debug logging to file ONLY - no console output
+
+    Idempotent: no-ops if a file handler is already configured. Runs
+    from on_mount rather than at import so the filename construction
+    and handler setup don't stall the first paint.
+    """
+    root_logger = logging.getLogger()
+    if any(isinstance(h, logging.FileHandler) for h in root_logger.handlers):
+        return
+
     log_file = f'tui_debug_{datetime.now().strftime("%Y%m%d_%H%M%S")}.log'
-    
+
     # Clear any existing handlers to ensure no console output
-    root_logger = logging.getLogger()
     root_logger.handlers = []
-    
+
     # Add only file handler
     file_handler = logging.FileHandler(log_file)
     file_handler.setLevel(logging.DEBUG)
     file_handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
     root_logger.addHandler(file_handler)
     root_logger.setLevel(logging.DEBUG)
-    
-    # Ensure no console output
-    logging.getLogger().handlers = [h for h in logging.getLogger().handlers if not isinstance(h, logging.StreamHandler)]
-    
+
+    logging.getLogger(__name__).info(f"Starting TUI debug log in {log_file}")
+
+
+if DEBUG_ENABLED:
     logger = logging.getLogger(__name__)
-    logger.info(f"Starting TUI debug log in {log_file}")
 else:
     # Production mode - disable all logging
     logging.disable(logging.CRITICAL)
-    logger = logging.getLogger(__name__)
+
+    class _NoopLogger:
+        """Absorbs logger calls without the logging framework's per-call
+        level check and record construction - the debug calls sit on the
+        render/refresh hot path"""
+        def __getattr__(self, _name):
+            return lambda *args, **kwargs: None
+
+    logger = _NoopLogger()
 
 from textual.app import App, ComposeResult
-from textual.containers import Container, Horizontal, Vertical, ScrollableContainer, Center
+from textual.containers import Container, Horizontal, Vertical, ScrollableContainer, Center, VerticalScroll
 from textual.widgets import Header, Footer, Static, Button, DataTable, Input, Label, LoadingIndicator, TabbedContent, TabPane, ProgressBar, TextArea
 from textual.binding import Binding
 from textual.screen import Screen
@@ -43,12 +61,21 @@ from textual.reactive import reactive
 from textual import work
 from textual.message import Message
 from rich.text import Text
+from collections import OrderedDict
 from datetime import datetime
+from functools import cached_property, partial
 from pathlib import Path
 import asyncio
 import json
+import platform
+import requests
+import queue
+import subprocess
+import sys
+import threading
+import time
 
-from carapace.db import Database
+from carapace.db import Database, json_dumps, json_loads
 from carapace.installer import AddonInstaller
 from carapace.parser import WikiParser
 from carapace.paths import PathDetector
@@ -56,75 +83,122 @@ from carapace.paths import PathDetector
 
 from textual.screen import ModalScreen, Screen
 
+# Tag -> (icon, style) for the table tag columns; a dict probe per tag
+# beats the old if/elif cascade that ran for every row on every refresh
+_TAG_ICONS = {
+    'recommended': ("🐢", "green"),  # Turtle for TurtleWoW recommended
+    'featured': ("♦", "bold cyan"),  # Diamond
+    'leveling': ("↑", "yellow"),  # Up arrow
+    'endgame': ("⚔", "red"),  # Swords
+    'superwow_required': ("!", "bold red"),  # Exclamation
+    'superwow_features': ("S", "magenta"),  # S for SuperWoW
+}
+
+# Shared status-cell Text instances for the tables; DataTable accepts
+# the same renderable for many rows, so build each combination once
+_STATUS_CELLS = {
+    (icon, style): Text(icon, style=style)
+    for icon, style in (
+        ("◆", "bold cyan"),  # Marked + Enabled / Not installed
+        ("◇", "dim cyan"),  # Marked + Disabled
+        ("✓", "green"),  # Installed and enabled
+        ("○", "dim"),  # Disabled
+        ("✗", "red"),  # Broken
+        ("?", "yellow"),  # Missing
+        ("·", "dim"),  # Available
+    )
+}
+
+# Pre-built markup for the details screen, keyed by effective status
+_STATUS_TEXTS = {
+    'installed': "[green]● INSTALLED[/green]",
+    'available': "[cyan]◯ AVAILABLE[/cyan]",
+    'broken': "[red]✗ BROKEN[/red]",
+}
+
+# Repo URLs considered standard by the debug URL filter: a plain
+# github/gitlab/bitbucket repo, optionally pinned to a branch via /tree/
+# on the git hosts. Compiled once instead of per row per refresh.
+_GOOD_URL_RE = re.compile(
+    r'^https?://'
+    r'(?:(?:github\.com|gitlab\.com)/[\w\-]+/[\w\-]+(?:/tree/[\w\-.]+)?'
+    r'|bitbucket\.org/[\w\-]+/[\w\-]+)'
+    r'/?$'
+)
+_BAD_URL_TOKENS = ('.zip', '.rar', '.7z', '/download/', '/releases/', '/wiki/', '/blob/')
+
+# Hot-path SQL as module constants so sqlite3's per-connection statement
+# cache hits on the identical string across calls
+_SQL_GET_INSTALLED_PATH = """
+    SELECT path FROM installed
+    WHERE name = ? AND deleted_at_utc IS NULL
+"""
+_SQL_GET_INSTALLED_ENABLED = """
+    SELECT name, enabled FROM installed
+    WHERE name = ? AND deleted_at_utc IS NULL
+"""
+_SQL_SET_ENABLED = """
+    UPDATE installed SET enabled = ?
+    WHERE name = ? AND deleted_at_utc IS NULL
+"""
+
+
+def _is_problematic_url(url) -> bool:
+    """Check if URL is non-standard or problematic"""
+    if not url:
+        return True  # No URL is problematic
+
+    # URLs with query params or fragments can never match the standard
+    # pattern, so these two substring scans short-circuit before the
+    # regex even runs
+    if '?' in url or '#' in url:
+        return True
+
+    url_lower = url.lower()
+
+    if _GOOD_URL_RE.match(url_lower):
+        return False  # URL matches standard pattern
+
+    # Check for problematic patterns. This stays behind the regex: a bad
+    # token can legitimately appear inside a matching URL (an owner named
+    # "releases", a branch named "v1.zip") and must not override it
+    if any(token in url_lower for token in _BAD_URL_TOKENS):
+        return True
+
+    # Tree URLs on GitHub/GitLab with unusual branch names are still fine
+    if '/tree/' in url_lower and ('github.com' in url_lower or 'gitlab.com' in url_lower):
+        return False
+
+    return True  # Default to problematic if not standard
+
+
+# Tag -> badge label for the details screen tag section
+_TAG_BADGES = {
+    'recommended': "🐢 recommended",
+    'featured': "💎 featured",
+    'leveling': "📈 leveling",
+    'endgame': "⚔️ endgame",
+    'superwow_required': "⚠️ superwow_required",
+}
+
+
 class InstallConfirmModal(ModalScreen):
-    """Confirmation dialog for addon installation"""
-    
-    DEFAULT_CSS = """
-    InstallConfirmModal {
-        align: center middle;
-        background: transparent;
-    }
-    
-    #confirm-container {
-        width: 50;
-        height: 13;
-        background: $panel;
-        border: thick $primary;
-        padding: 1;
-    }
-    
-    #confirm-title {
-        text-style: bold;
-        color: $text;
-        text-align: center;
-        margin-top: 1;
-        margin-bottom: 1;
-    }
-    
-    #confirm-message {
-        text-align: center;
-        color: $text;
-        margin-bottom: 1;
-    }
-    
-    #button-container {
-        align: center middle;
-        height: 3;
-    }
-    
-    #yes-button {
-        margin: 0 1;
-        min-width: 9;
-        background: $surface;
-        color: $text;
-        padding: 0 1;
-    }
-    
-    #no-button {
-        margin: 0 1;
-        min-width: 8;
-        background: $surface;
-        color: $text;
-        padding: 0 1;
-    }
-    
-    #yes-button:focus {
-        background: $primary;
-        color: $background;
-    }
-    
-    #no-button:focus {
-        background: $primary;
-        color: $background;
-    }
+    """Confirmation dialog for addon installation
+
+    Styled by carapace.tcss, parsed once at app load.
     """
-    
+
     BINDINGS = [
         ("escape", "cancel", "Cancel"),
         ("y", "confirm", "Yes"),
         ("n", "cancel", "No"),
+        Binding("left", "focus_yes", "", show=False),
+        Binding("right", "focus_no", "", show=False),
+        # Priority so the screen, not the focused button, handles enter -
+        # prevents the press from triggering twice
+        Binding("enter", "activate_focused", "", show=False, priority=True),
     ]
-    
+
     def __init__(self, addon_name: str):
         super().__init__()
         self.addon_name = addon_name
@@ -145,26 +219,22 @@ class InstallConfirmModal(ModalScreen):
         """Focus on Yes button by default"""
         self.query_one("#yes-button", Button).focus()
     
-    def on_key(self, event) -> None:
-        """Handle arrow key navigation and enter key"""
-        if event.key == "left":
-            self.query_one("#yes-button", Button).focus()
-            event.stop()
-        elif event.key == "right":
-            self.query_one("#no-button", Button).focus()
-            event.stop()
-        elif event.key == "enter":
-            # Check which button is focused and trigger it
-            focused = self.focused
-            if focused and isinstance(focused, Button):
-                if focused.id == "yes-button":
-                    self.action_confirm()
-                elif focused.id == "no-button":
-                    self.action_cancel()
-            # Always stop enter from bubbling to prevent double-triggering
-            event.stop()
-            event.prevent_default()
-    
+    def action_focus_yes(self) -> None:
+        """Move focus to the Yes button"""
+        self.query_one("#yes-button", Button).focus()
+
+    def action_focus_no(self) -> None:
+        """Move focus to the No button"""
+        self.query_one("#no-button", Button).focus()
+
+    def action_activate_focused(self) -> None:
+        """Trigger whichever button currently has focus"""
+        focused = self.focused
+        if focused is not None and focused.id == "no-button":
+            self.action_cancel()
+        else:
+            self.action_confirm()
+
     def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button presses"""
         if event.button.id == "yes-button":
@@ -184,56 +254,11 @@ class InstallConfirmModal(ModalScreen):
 
 
 class EditAddonModal(ModalScreen):
-    """Modal for editing addon details"""
-    
-    DEFAULT_CSS = """
-    EditAddonModal {
-        align: center middle;
-        background: transparent;
-    }
-    
-    #edit-container {
-        width: 80;
-        height: auto;
-        max-height: 40;
-        background: $panel;
-        border: thick $primary;
-        padding: 1 2;
-    }
-    
-    #edit-title {
-        text-style: bold;
-        color: $text;
-        margin-bottom: 1;
-    }
-    
-    .edit-field {
-        margin-bottom: 1;
-    }
-    
-    .field-label {
-        color: $text;
-        text-style: bold;
-        margin-bottom: 0;
-    }
-    
-    Input {
-        width: 100%;
-        margin-top: 0;
-        background: $boost;
-        color: $text;
-    }
-    
-    #button-container {
-        align: center middle;
-        margin-top: 1;
-    }
-    
-    Button {
-        margin: 0 1;
-    }
+    """Modal for editing addon details
+
+    Styled by carapace.tcss, parsed once at app load.
     """
-    
+
     BINDINGS = [
         ("escape", "cancel", "Cancel"),
         ("ctrl+s", "save", "Save"),
@@ -288,71 +313,47 @@ class EditAddonModal(ModalScreen):
     
     def action_save(self) -> None:
         """Save the edited addon details"""
-        from carapace.db import Database
-        
         try:
             # Get values from inputs
             new_name = self.query_one("#edit-name", Input).value
             description = self.query_one("#edit-description", Input).value
             repo_url = self.query_one("#edit-repo-url", Input).value
             override_url = self.query_one("#edit-override-url", Input).value
-            
-            # Update database
-            db = Database()
-            cursor = db.conn.cursor()
-            
-            # Check if anything was manually edited
-            cursor.execute("""
-                SELECT name, description, repo_url, override_url 
-                FROM addons WHERE name = ?
-            """, (self.addon_name,))
-            original = cursor.fetchone()
-            
+
             # Smart protection: If user edited name or description but didn't set override,
-            # automatically set override_url = repo_url to protect from wiki sync
-            if original:
-                changed = (new_name != original['name'] or 
-                          description != (original['description'] or '') or
-                          repo_url != (original['repo_url'] or ''))
-                
-                # If override is empty but something changed, set override = repo
-                if changed and not override_url:
-                    override_url = repo_url
-                # If override equals repo_url, store it as NULL (to save space)
-                elif override_url == repo_url:
-                    override_url = repo_url  # Still store it to maintain protection
-            
-            # If name changed, update both addons and installed tables
-            if new_name != self.addon_name:
-                # Update addon name
-                cursor.execute("""
-                    UPDATE addons 
-                    SET name = ?, description = ?, repo_url = ?, override_url = ?
-                    WHERE name = ?
-                """, (new_name, description, repo_url, override_url if override_url else None, self.addon_name))
-                
-                # Update installed table if installed
-                cursor.execute("""
-                    UPDATE installed 
-                    SET name = ?
-                    WHERE name = ? AND deleted_at_utc IS NULL
-                """, (new_name, self.addon_name))
-            else:
-                # Just update other fields
-                cursor.execute("""
-                    UPDATE addons 
-                    SET description = ?, repo_url = ?, override_url = ?
+            # automatically set override_url = repo_url to protect from wiki sync.
+            # The modal was opened from a fresh SELECT, so self.addon_data
+            # already holds the original values - no need to re-query.
+            changed = (new_name, description, repo_url) != (
+                self.addon_name,
+                self.addon_data.get('description') or '',
+                self.addon_data.get('repo_url') or '')
+            override_url = override_url or (repo_url if changed else '')
+
+            # One transaction (and one fsync) on the app's long-lived
+            # connection instead of SELECT + UPDATEs on a fresh one
+            conn = self.app.db.conn
+            with conn:
+                conn.execute("""
+                    UPDATE addons
+                    SET name = ?, description = ?, repo_url = ?,
+                        override_url = CASE WHEN ? = '' THEN NULL ELSE ? END
                     WHERE name = ?
-                """, (description, repo_url, override_url if override_url else None, self.addon_name))
-            
-            db.conn.commit()
-            db.close()
-            
+                """, (new_name, description, repo_url, override_url, override_url, self.addon_name))
+
+                # Keep the installed table in sync if the name changed
+                if new_name != self.addon_name:
+                    conn.execute("""
+                        UPDATE installed
+                        SET name = ?
+                        WHERE name = ? AND deleted_at_utc IS NULL
+                    """, (new_name, self.addon_name))
+
             self.app.notify(f"Saved changes to {new_name}")
             self.app.pop_screen()
-            
-            # Refresh the addon table
-            self.app.load_all_addons()
+
+            # Patch the one edited row rather than reloading every addon
+            self.app.update_addon_row(self.addon_name, new_name, description, repo_url, override_url)
             
         except Exception as e:
             self.app.notify(f"Failed to save: {e}", severity="error")
@@ -363,8 +364,11 @@ class EditAddonModal(ModalScreen):
 
 
 class AddonDetailsScreen(Screen):
-    """Beautiful full-screen addon details view"""
-    
+    """Beautiful full-screen addon details view
+
+    Styled by carapace.tcss, parsed once at app load.
+    """
+
     BINDINGS = [
         ("escape", "dismiss", "Back"),
         ("q", "dismiss", "Back"),
@@ -372,81 +376,7 @@ class AddonDetailsScreen(Screen):
         ("i", "install", "Install"),
         ("e", "edit", "Edit"),
     ]
-    
-    DEFAULT_CSS = """
-    AddonDetailsScreen {
-        background: $surface;
-    }
-    
-    #details-header {
-        dock: top;
-        height: 5;
-        background: $boost;
-        border-bottom: solid $primary;
-        padding: 1 2;
-    }
-    
-    #addon-name {
-        text-style: bold;
-        text-align: center;
-        color: $text;
-    }
-    
-    #addon-status {
-        text-align: center;
-        margin-top: 1;
-    }
-    
-    #details-content {
-        padding: 2 4;
-        overflow-y: auto;
-    }
-    
-    .detail-section {
-        margin-bottom: 2;
-        background: $boost;
-        border: tall $primary 30%;
-        padding: 1 2;
-    }
-    
-    .section-title {
-        text-style: bold underline;
-        color: $primary;
-        margin-bottom: 1;
-    }
-    
-    .detail-field {
-        margin: 1 0;
-        color: $text;
-    }
-    
-    .field-label {
-        color: $primary;
-        text-style: bold;
-    }
-    
-    .tag-badge {
-        background: $primary;
-        color: $surface;
-        padding: 0 1;
-        margin: 0 1;
-    }
-    
-    #details-footer {
-        dock: bottom;
-        height: 3;
-        background: $boost;
-        border-top: solid $primary;
-        padding: 0 2;
-        text-align: center;
-    }
-    
-    .url-link {
-        color: $accent;
-        text-style: underline;
-    }
-    """
-    
+
     def __init__(self, addon_name: str, addon_data: dict):
         super().__init__()
         self.addon_name = addon_name
@@ -459,16 +389,10 @@ class AddonDetailsScreen(Screen):
             
             status = self.addon_data.get('status', 'available')
             installed = self.addon_data.get('installed', False)
-            
-            if installed:
-                status_text = "[green]● INSTALLED[/green]"
-            elif status == 'available':
-                status_text = "[cyan]◯ AVAILABLE[/cyan]"
-            elif status == 'broken':
-                status_text = "[red]✗ BROKEN[/red]"
-            else:
-                status_text = f"[yellow]◐ {status.upper()}[/yellow]"
-            
+
+            status_text = _STATUS_TEXTS.get('installed' if installed else status,
+                                            f"[yellow]◐ {status.upper()}[/yellow]")
+
             yield Static(status_text, id="addon-status")
         
         # Main content
@@ -479,55 +403,51 @@ class AddonDetailsScreen(Screen):
                 desc = self.addon_data.get('description', 'No description available')
                 yield Static(desc, classes="detail-field")
             
-            # URLs section
+            # URLs section - one pre-built Text so Textual lays out a
+            # single widget per section instead of one per field
             urls_exist = self.addon_data.get('url') or self.addon_data.get('repo_url')
             if urls_exist:
                 with Container(classes="detail-section"):
                     yield Static("🔗 Links", classes="section-title")
-                    
-                    url = self.addon_data.get('url')
-                    if url:
-                        yield Static(f"[bold]Homepage:[/bold] {url}", classes="detail-field")
-                    
-                    repo = self.addon_data.get('repo_url')
-                    if repo:
-                        yield Static(f"[bold]Repository:[/bold] {repo}", classes="detail-field")
-                    
-                    override = self.addon_data.get('override_url')
-                    if override:
-                        yield Static(f"[bold]Override:[/bold] {override}", classes="detail-field")
-            
+
+                    links = Text()
+                    for label, key in (("Homepage: ", 'url'),
+                                       ("Repository: ", 'repo_url'),
+                                       ("Override: ", 'override_url')):
+                        value = self.addon_data.get(key)
+                        if value:
+                            if links.plain:
+                                links.append("\n")
+                            links.append(label, style="bold")
+                            links.append(value)
+                    yield Static(links, classes="detail-field")
+
             # Tags section
             tags = self.addon_data.get('tags', [])
             if tags:
                 with Container(classes="detail-section"):
                     yield Static("🏷️ Tags", classes="section-title")
-                    with Horizontal():
-                        for tag in tags:
-                            # Special formatting for certain tags
-                            if tag == 'recommended':
-                                yield Static(f"🐢 {tag}", classes="tag-badge")
-                            elif tag == 'featured':
-                                yield Static(f"💎 {tag}", classes="tag-badge")
-                            elif tag == 'leveling':
-                                yield Static(f"📈 {tag}", classes="tag-badge")
-                            elif tag == 'endgame':
-                                yield Static(f"⚔️ {tag}", classes="tag-badge")
-                            elif tag == 'superwow_required':
-                                yield Static(f"⚠️ {tag}", classes="tag-badge")
-                            else:
-                                yield Static(tag, classes="tag-badge")
-            
+                    badges = Text()
+                    for tag in tags:
+                        if badges.plain:
+                            badges.append("  ")
+                        badges.append(_TAG_BADGES.get(tag, tag), style="bold")
+                    yield Static(badges, classes="detail-field")
+
             # Installation info section (if installed)
             if installed:
                 with Container(classes="detail-section"):
                     yield Static("💾 Installation Info", classes="section-title")
-                    version = self.addon_data.get('version', 'Unknown')
-                    yield Static(f"[bold]Version:[/bold] {version}", classes="detail-field")
-                    
+                    info = Text()
+                    info.append("Version: ", style="bold")
+                    info.append(str(self.addon_data.get('version', 'Unknown')))
+
                     path = self.addon_data.get('path')
                     if path:
-                        yield Static(f"[bold]Location:[/bold] {path}", classes="detail-field")
+                        info.append("\n")
+                        info.append("Location: ", style="bold")
+                        info.append(str(path))
+                    yield Static(info, classes="detail-field")
         
         # Footer with actions hint
         with Container(id="details-footer"):
@@ -553,121 +473,15 @@ class CarapaceTUI(App):
     
     TITLE = "Carapace - TurtleWoW Addon Manager"
     # Theme is set via command line or environment variable
-    
+
     # Disable command palette
     ENABLE_COMMAND_PALETTE = False
-    
-    def __init__(self):
-        super().__init__()
-        # Preserve cursor positions for each tab
-        self.all_table_cursor = None
-        self.installed_table_cursor = None
-    
-    CSS = """
-    Screen {
-        background: $surface;
-        padding: 0;
-        margin: 0;
-    }
-    
-    ModalScreen {
-        background: transparent;
-    }
-    
-    #search-row, #search-row-installed {
-        height: 3;
-        margin: 0 0 1 0;
-    }
-    
-    #search-all, #search-installed {
-        width: 30%;
-        min-width: 20;
-        height: 3;
-        background: $boost;
-        border: none;
-        margin: 0 1;
-        padding: 1 1;
-    }
-    
-    DataTable {
-        height: 1fr;
-        scrollbar-size: 1 1;
-    }
-    
-    DataTable > .datatable--header {
-        text-style: bold;
-        background: $primary 20%;
-        color: $text;
-        text-align: center;
-    }
-    
-    DataTable > .datatable--cursor {
-        background: $primary 40%;
-        color: $text;
-        text-style: bold;
-    }
-    
-    DataTable:focus > .datatable--cursor {
-        background: $primary 60%;
-    }
-    
-    DataTable > .datatable--odd-row {
-        background: $boost;
-    }
-    
-    DataTable > .datatable--even-row {
-        background: $surface;
-    }
-    
-    #status-bar {
-        dock: bottom;
-        height: 1;
-        background: $primary 20%;
-        color: $text;
-        padding: 0 1;
-    }
-    
-    #addon-counter, #installed-counter {
-        width: auto;
-        min-width: 10;
-        height: 3;
-        padding: 1;
-        text-align: center;
-        color: $text;
-        background: $boost;
-        border: none;
-        margin: 0 1;
-    }
-    
-    #action-bar, #action-bar-installed {
-        width: 1fr;
-        height: 3;
-        padding: 0 1;
-        text-align: left;
-        background: $boost;
-        border: none;
-        color: $text;
-        margin: 0 1;
-        padding-left: 1;
-        padding-right: 1;
-    }
-    
-    /* Removed menu-bar - integrated into search row */
-    
-    TabbedContent {
-        height: 1fr;
-    }
-    
-    TabPane {
-        padding: 0 1;
-    }
-    
-    TabbedContent ContentSwitcher {
-        padding: 0;
-        height: 1fr;
-    }
-    """
-    
+
+    # One shared stylesheet for the app and all modal screens, compiled
+    # once at load; modal open/close no longer re-parses CSS. Resolved
+    # against this module so the frozen build finds the bundled copy
+    CSS_PATH = Path(__file__).with_name("carapace.tcss")
+
     BINDINGS = [
         Binding("escape", "quit", "Exit Carapace"),
         Binding("f1", "show_help", "Help"),
@@ -689,74 +503,145 @@ class CarapaceTUI(App):
     
     def __init__(self):
         super().__init__()
-        self.parser = WikiParser()
-        self.addon_path = PathDetector().get_addon_path()
+        # Preserve cursor positions for each tab
+        self.all_table_cursor = None
+        self.installed_table_cursor = None
+        # Long-lived connection for main-thread UI work (modals etc.);
+        # worker threads get their own via _worker_db
+        self.db = Database()
+        self._db_local = threading.local()
+        self._installer_gen = 0  # bumped when the catalogue changes
+        # Filled by the background database-update check started in run_tui
+        self.db_update_queue = queue.Queue()
         self.all_addons = []
+        self._all_by_key = {}  # lowercase name -> addon dict
         self.installed_addons = {}
         self.current_filter = ""
         self.selected_addon = None
         self.marked_addons = set()  # For multiple selection
+        self._marked_dirty = True  # Marked-row snapshot needs rebuilding
+        self._marked_row_keys = []  # Cached row keys of marked addons
         self.debug_url_filter = False  # Hidden filter for problematic URLs
-    
+        self._pending_right_click_mark = False  # Right-click awaiting a mark
+        self._addon_before_click = None  # Selection before the right-click
+        self._repaint_pending = False  # Coalesces mark-triggered repaints
+        self._update_worker = None  # Handle for the background update check
+        self._filter_timer = None  # Debounce timer for search input
+        # Small LRU of filter results keyed by (data version, filter);
+        # retyping or clearing a query skips the full partition scan
+        self._all_addons_ver = 0
+        self._filter_cache = OrderedDict()
+        self._details_cache = OrderedDict()  # screen name -> addon_data shown
+        # Displayed (ordered keys, per-row state) per table, used to diff
+        # refreshes instead of clearing and re-adding every row
+        self._all_table_state = ([], {})
+        self._installed_table_state = ([], {})
+
+    @cached_property
+    def http(self):
+        """Shared HTTP session so the TLS handshake to the wiki is paid
+        once per run instead of per request"""
+        session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=4)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    @cached_property
+    def parser(self):
+        """Wiki parser, created on first sync rather than at startup"""
+        return WikiParser(session=self.http)
+
+    @cached_property
+    def addon_path(self):
+        """AddOns directory, detected on first use rather than at startup
+
+        Path detection can walk several drives looking for the WoW
+        install, so it must not run before first paint; _warm_addon_path
+        fills this cache from a worker thread instead.
+        """
+        return PathDetector().get_addon_path()
+
+    @work(thread=True)
+    def _warm_addon_path(self) -> None:
+        """Run path detection concurrently with first paint"""
+        _ = self.addon_path
+
     def compose(self) -> ComposeResult:
         logger.debug("Composing TUI widgets")
         yield Header(show_clock=True)
         
-        with TabbedContent(initial="all-tab"):
+        # Keep direct references to the widgets the key handlers touch so
+        # every keypress doesn't have to walk the DOM with query_one
+        self._action_bar = Static("", id="action-bar")  # Will be updated with proper theme colors
+        self._action_bar_installed = Static("", id="action-bar-installed")
+        self._tabbed = TabbedContent(initial="all-tab")
+        self._search_all = Input(placeholder="Type to search...", id="search-all")
+        self._search_installed = Input(placeholder="Type to search...", id="search-installed")
+        self._all_table = DataTable(id="all-table", zebra_stripes=True, cursor_type="row")
+        self._installed_table = DataTable(id="installed-table", zebra_stripes=True, cursor_type="row")
+
+        with self._tabbed:
             with TabPane("All Addons", id="all-tab"):
                 yield Horizontal(
-                    Input(placeholder="Type to search...", id="search-all"),
+                    self._search_all,
                     Static("0 of 0", id="addon-counter"),
-                    Static("", id="action-bar"),  # Will be updated with proper theme colors
+                    self._action_bar,
                     id="search-row"
                 )
-                yield DataTable(id="all-table", zebra_stripes=True, cursor_type="row")
-            
+                yield self._all_table
+
             with TabPane("Installed", id="installed-tab"):
                 yield Horizontal(
-                    Input(placeholder="Type to search...", id="search-installed"),
+                    self._search_installed,
                     Static("0 of 0", id="installed-counter"),
-                    Static("", id="action-bar-installed"),  # Will be updated with proper theme colors
+                    self._action_bar_installed,
                     id="search-row-installed"
                 )
-                yield DataTable(id="installed-table", zebra_stripes=True, cursor_type="row")
+                yield self._installed_table
         
         # No footer or status bar to maximize space
         logger.debug("Compose complete")
     
     
-    def format_tag_icons(self, tags: list):
+    # Only a handful of tag combinations exist across hundreds of rows,
+    # so memoize the rendered Text per combination
+    _tag_icon_cache: dict = {}
+
+    def format_tag_icons(self, tags):
         """Convert tags to colored icon representation - returns Rich Text object"""
-        from rich.text import Text
-        icons = Text()
-        
-        for tag in tags:
-            if tag == 'recommended':
-                icons.append("🐢", style="green")  # Turtle for TurtleWoW recommended
-            elif tag == 'featured':
-                icons.append("♦", style="bold cyan")  # Diamond
-            elif tag == 'leveling':
-                icons.append("↑", style="yellow")  # Up arrow
-            elif tag == 'endgame':
-                icons.append("⚔", style="red")  # Swords
-            elif tag == 'superwow_required':
-                icons.append("!", style="bold red")  # Exclamation
-            elif tag == 'superwow_features':
-                icons.append("S", style="magenta")  # S for SuperWoW
-            
-            if icons.plain:  # Only add space if we have content
-                icons.append(" ")
-        
+        key = tuple(tags)
+        icons = self._tag_icon_cache.get(key)
+        if icons is None:
+            # Text.assemble builds all spans in one go, avoiding per-append
+            # style merging for every cell of every rendered row
+            parts = []
+            for tag in key:
+                entry = _TAG_ICONS.get(tag)
+                if entry:
+                    parts.append(entry)
+                    parts.append(" ")
+
+            icons = Text.assemble(*parts) if parts else Text()
+            self._tag_icon_cache[key] = icons
         return icons
     
     
-    def format_action_bar(self, tab="all") -> str:
+    # The action bar text never changes at runtime, so build each tab's
+    # Text once and reuse it on every mount/tab switch
+    _ACTION_BAR_CACHE: dict = {}
+
+    def format_action_bar(self, tab="all"):
         """Format the action bar with theme-appropriate colors using Rich Text"""
-        from rich.text import Text
-        
+        if tab not in self._ACTION_BAR_CACHE:
+            self._ACTION_BAR_CACHE[tab] = self._build_action_bar(tab)
+        return self._ACTION_BAR_CACHE[tab]
+
+    def _build_action_bar(self, tab="all"):
+        """Build the Rich Text for an action bar (cached by format_action_bar)"""
         # Create a Rich Text object for proper styling
         text = Text()
-        
+
         if tab == "all":
             # Line 1: F1 Help           F2 Install         F3 Uninstall      F4 Enable/Disable Addon
             text.append(" ", style="dim")  # Left padding
@@ -838,107 +723,210 @@ class CarapaceTUI(App):
     @work(exclusive=True, thread=True)
     def check_for_app_updates(self) -> None:
         """Check for application updates in background"""
+        started = time.monotonic()
         try:
             from carapace.app_updater import check_for_app_updates
-            update_info = check_for_app_updates()
+            # Tight timeout: a hung GitHub API call must not keep the
+            # worker thread alive for the rest of the session
+            update_info = check_for_app_updates(timeout=3.0)
             if update_info:
                 msg = f"Update available: v{update_info['new_version']} (current: v{update_info['current_version']})"
                 self.call_from_thread(self.notify, msg, severity="information", timeout=10)
         except Exception as e:
-            logger.debug(f"Could not check for app updates: {e}")
+            logger.debug(f"Could not check for app updates after {time.monotonic() - started:.1f}s: {e}")
+
+    def on_unmount(self) -> None:
+        """Cancel background work when the app shuts down"""
+        if self._update_worker is not None:
+            self._update_worker.cancel()
     
     def on_mount(self) -> None:
         """Called when app is mounted"""
+        if DEBUG_ENABLED:
+            _setup_debug_logging()
+
         # Set the Tokyo Night theme
         self.theme = "tokyo-night"
         logger.info("Theme set to tokyo-night")
         
         # Update action bars with proper theme colors
+        self._action_bar.update(self.format_action_bar("all"))
+        self._action_bar_installed.update(self.format_action_bar("installed"))
+
+        # Check for application updates in background (non-blocking);
+        # keep the worker handle so shutdown can cancel a slow check
+        self._update_worker = self.check_for_app_updates()
+
+        # Warm the addon-path cache off the event loop
+        self._warm_addon_path()
+
+        # Poll for the result of the database-update check running
+        # alongside startup (see run_tui)
+        self._db_update_timer = self.set_interval(1.0, self._poll_db_update_queue)
+
+    def _poll_db_update_queue(self) -> None:
+        """Surface the background database-update result, if any"""
         try:
-            action_bar = self.query_one("#action-bar", Static)
-            action_bar.update(self.format_action_bar("all"))
-        except:
-            pass
-        
-        # Check for application updates in background (non-blocking)
-        self.check_for_app_updates()
-        
-        try:
-            action_bar_installed = self.query_one("#action-bar-installed", Static)
-            action_bar_installed.update(self.format_action_bar("installed"))
-        except:
-            pass
-    
+            version = self.db_update_queue.get_nowait()
+        except queue.Empty:
+            return
+        self._db_update_timer.stop()
+        self.notify(f"Addon database v{version} downloaded - restart to apply", timeout=10)
+
     def on_ready(self) -> None:
         """Called when app is fully ready"""
         logger.info("TUI ready")
         
         # Update action bars with proper theme colors
-        try:
-            action_bar = self.query_one("#action-bar", Static)
-            action_bar.update(self.format_action_bar("all"))
-        except:
-            pass
-        
-        try:
-            action_bar_installed = self.query_one("#action-bar-installed", Static)
-            action_bar_installed.update(self.format_action_bar("installed"))
-        except:
-            pass
-        
+        self._action_bar.update(self.format_action_bar("all"))
+        self._action_bar_installed.update(self.format_action_bar("installed"))
+
         # Focus the search input initially
-        self.query_one("#search-all", Input).focus()
-        
-        logger.info("Starting worker threads to load data")
-        self.load_all_addons()
-        self.load_installed_addons()
+        self._search_all.focus()
         
-        # Trigger a refresh after a short delay to ensure checkmarks show
-        self.set_timer(0.5, lambda: self.update_all_table())
+        logger.info("Starting worker thread to load data")
+        self.load_state()
     
     
     
     
+    def _worker_db(self) -> Database:
+        """Database connection for the calling worker thread
+
+        sqlite3 connections are bound to the thread that created them, so
+        each of Textual's worker threads keeps one long-lived connection
+        instead of opening and closing a fresh one per action. They live
+        for the process lifetime; there is no cross-thread close.
+        """
+        db = getattr(self._db_local, 'db', None)
+        if db is None:
+            db = Database()
+            self._db_local.db = db
+        return db
+
+    def _worker_installer(self) -> AddonInstaller:
+        """AddonInstaller for the calling worker thread
+
+        Constructing an installer resolves the addon path and builds the
+        repo-URL cache from the database; reusing one per thread pays
+        that cost once instead of on every action. The repo cache is
+        rebuilt lazily when a wiki sync changes the catalogue (tracked
+        via _installer_gen).
+        """
+        installer = getattr(self._db_local, 'installer', None)
+        if installer is None:
+            installer = AddonInstaller(self._worker_db())
+            self._db_local.installer = installer
+            self._db_local.installer_gen = self._installer_gen
+        elif self._db_local.installer_gen != self._installer_gen:
+            installer._repo_to_addon_cache = {}
+            installer._build_repo_cache()
+            self._db_local.installer_gen = self._installer_gen
+        return installer
+
+    def _read_all_addons(self, db) -> None:
+        """Load the addon catalogue from an open database connection"""
+        cursor = db.conn.cursor()
+        cursor.execute("""
+            SELECT name, description, homepage_url, repo_url, status, tags
+            FROM addons
+            WHERE deleted_at_utc IS NULL
+            ORDER BY name
+        """)
+        logger.debug("Query executed")
+
+        # Iterate the cursor directly rather than materialising an
+        # intermediate list of every row via fetchall
+        cursor.arraysize = 512
+        addons = []
+        # Most addons share one of a handful of tag combinations, so parse
+        # each distinct JSON string once and reuse the list (read-only
+        # downstream) instead of running json.loads per row
+        tags_cache: dict = {}
+        for row in cursor:
+            # Skip addons with empty names
+            if not row[0]:
+                continue
+
+            raw_tags = row[5]
+            tags = tags_cache.get(raw_tags)
+            if tags is None:
+                tags = json_loads(raw_tags) if raw_tags else []
+                tags_cache[raw_tags] = tags
+
+            addon = {
+                'name': row[0],
+                'description': row[1] or '',
+                'url': row[2] or '',
+                'repo_url': row[3] or '',
+                'status': row[4] or 'available',
+                'tags': tags
+            }
+            # Pre-lowered copies so the filter loop doesn't allocate
+            # two fresh strings per row per keystroke
+            addon['name_lower'] = addon['name'].lower()
+            addon['description_lower'] = addon['description'].lower()
+            addons.append(addon)
+
+        # Update instance variable, plus a name index so other views
+        # can look addons up without scanning the list
+        self.all_addons = addons
+        self._all_by_key = {a['name_lower']: a for a in addons}
+        self._bump_addons_ver()
+
+        logger.info(f"Loaded {len(addons)} addons from database")
+
+    @staticmethod
+    def _annotate_installed(installed: dict) -> dict:
+        """Precompute the display strings derived from installed state
+
+        The folder basename and version fallback never change between
+        loads, so compute them once here instead of per row on every
+        table rebuild.
+        """
+        for addon in installed.values():
+            addon['_folder'] = Path(addon['path']).name if addon['path'] else 'Unknown'
+            addon['_version_str'] = addon['version'] or 'Unknown'
+        return installed
+
+    def _read_installed_addons(self) -> None:
+        """Load installed-addon state via the thread's installer"""
+        installer = self._worker_installer()
+        installer.sync_installed_state()
+        self.installed_addons = self._annotate_installed(installer.get_installed_addons())
+        self._bump_addons_ver()
+
+    @work(thread=True)
+    def load_state(self) -> None:
+        """Reload catalogue and installed state on one connection
+
+        One worker and one connection beat the two separate loaders:
+        SQLite reads sequentially anyway, and both tables refresh in a
+        single main-thread wakeup instead of two.
+        """
+        try:
+            db = self._worker_db()
+            self._read_all_addons(db)
+            self._read_installed_addons()
+
+            self.call_from_thread(self._refresh_tables)
+        except Exception as e:
+            logger.error(f"Error loading state: {e}", exc_info=True)
+
+    def _refresh_tables(self) -> None:
+        """Repaint both tables after a state reload"""
+        self.update_all_table()
+        self.update_installed_table()
+
     @work(thread=True)
     def load_all_addons(self) -> None:
         """Load all addons from database"""
         logger.info("load_all_addons thread started")
-        
+
         try:
-            db = Database()
-            cursor = db.conn.cursor()
-            logger.debug("Database connection established")
-            cursor.execute("""
-                SELECT name, description, homepage_url, repo_url, status, tags
-                FROM addons
-                WHERE deleted_at_utc IS NULL
-                ORDER BY name
-            """)
-            logger.debug("Query executed")
-            
-            addons = []
-            for row in cursor.fetchall():
-                # Skip addons with empty names
-                if not row[0]:
-                    continue
-                    
-                addon = {
-                    'name': row[0],
-                    'description': row[1] or '',
-                    'url': row[2] or '',
-                    'repo_url': row[3] or '',
-                    'status': row[4] or 'available',
-                    'tags': json.loads(row[5]) if row[5] else []
-                }
-                addons.append(addon)
-            
-            # Update instance variable
-            self.all_addons = addons
-            
-            logger.info(f"Loaded {len(addons)} addons from database")
-            
-            db.close()
-            
+            db = self._worker_db()
+            self._read_all_addons(db)
+
             # Only update table if installed addons are already loaded
             # Otherwise wait for installed addons to load first
             if self.installed_addons is not None:
@@ -946,25 +934,15 @@ class CarapaceTUI(App):
                 logger.debug("Calling update_all_table from thread")
                 self.call_from_thread(self.update_all_table)
                 logger.debug("Update scheduled")
-            
-            # Also try updating synchronously as a test
-            # self.update_all_table()
-            
+
         except Exception as e:
             logger.error(f"Error loading all addons: {e}", exc_info=True)
-    
+
     @work(thread=True)
     def load_installed_addons(self) -> None:
         """Load installed addons"""
-        db = Database()
-        installer = AddonInstaller(db)
-        installer.sync_installed_state()
-        installed = installer.get_installed_addons()
-        db.close()
-        
-        # Update instance variable
-        self.installed_addons = installed
-        
+        self._read_installed_addons()
+
         # Schedule UI updates on main thread
         self.call_from_thread(self.update_installed_table)
         # Don't update all table here - let the caller handle it with cursor preservation
@@ -972,7 +950,7 @@ class CarapaceTUI(App):
     @work(thread=True)
     def load_broken_addons(self) -> None:
         """Load broken addons from database"""
-        db = Database()
+        db = self._worker_db()
         cursor = db.conn.cursor()
         cursor.execute("""
             SELECT name, description, homepage_url, status
@@ -982,8 +960,9 @@ class CarapaceTUI(App):
             ORDER BY name
         """)
         
+        cursor.arraysize = 512
         broken = []
-        for row in cursor.fetchall():
+        for row in cursor:
             broken.append({
                 'name': row[0],
                 'description': row[1] or '',
@@ -991,7 +970,6 @@ class CarapaceTUI(App):
                 'status': row[3]
             })
         
-        db.close()
         
         # Schedule UI update on main thread
         self.call_from_thread(self.update_broken_table, broken)
@@ -1000,15 +978,86 @@ class CarapaceTUI(App):
         """Update the all addons table while preserving cursor position"""
         # Since update_all_table now preserves cursor internally, just call it
         self.update_all_table()
+
+    def update_addon_row(self, old_name: str, new_name: str, description: str,
+                         repo_url: str, override_url: str = '') -> None:
+        """Patch a single edited addon in place instead of reloading everything"""
+        for addon in self.all_addons:
+            if addon['name'] == old_name:
+                addon['name'] = new_name
+                addon['name_lower'] = new_name.lower()
+                addon['description'] = description
+                addon['description_lower'] = description.lower()
+                addon['repo_url'] = repo_url
+                self._bump_addons_ver()
+                break
+        else:
+            # Not in memory (shouldn't happen) - fall back to a full reload
+            self.load_all_addons()
+            return
+
+        if new_name != old_name:
+            # DataTable row keys are immutable, so a rename still needs
+            # the full rebuild to re-key and re-sort the row
+            self.load_all_addons()
+            return
+
+        # Common case (description/URL edit): update just the one cell
+        try:
+            table = self._all_table
+            table.update_cell(old_name, "description", Text(description, style="dim"))
+        except Exception as e:
+            logger.debug(f"Single-row update failed, rebuilding table: {e}")
+            self.update_all_table()
     
+    _ALL_COLUMNS = ("status", "name", "tags", "description")
+    _INSTALLED_COLUMNS = ("status", "name", "folder", "version", "tags", "description")
+
+    def _apply_table_diff(self, table, columns, ordered_keys, new_state,
+                          old_keys, old_state, build_row) -> None:
+        """Reconcile a DataTable with the desired rows instead of rebuilding
+
+        new_state maps row key -> comparable cell-state tuple, and
+        build_row(key) produces the renderables for add_row. Rows that
+        merely disappeared are removed in place and changed cells are
+        updated individually; insertions or reorders fall back to a full
+        clear + re-add.
+        """
+        if not old_keys or not table.row_count:
+            if table.row_count:
+                table.clear(columns=False)
+            for key in ordered_keys:
+                table.add_row(*build_row(key), key=key)
+            return
+
+        if ordered_keys != old_keys:
+            new_set = set(ordered_keys)
+            if ordered_keys == [k for k in old_keys if k in new_set]:
+                # Deletion-only delta with ordering preserved (the usual
+                # narrowing-filter keystroke): drop the vanished rows
+                for key in old_keys:
+                    if key not in new_set:
+                        table.remove_row(key)
+            else:
+                # Insertions or reorders: rebuild from scratch
+                table.clear(columns=False)
+                for key in ordered_keys:
+                    table.add_row(*build_row(key), key=key)
+                return
+
+        # Patch only rows whose content actually changed
+        for key in ordered_keys:
+            if new_state[key] != old_state.get(key):
+                for column, cell in zip(columns, build_row(key)):
+                    table.update_cell(key, column, cell, update_width=True)
+
     def update_all_table(self) -> None:
         """Update the all addons table"""
-        import time
         call_time = time.time()
         logger.info(f"update_all_table called at {call_time:.3f} with {len(self.all_addons)} addons")
         
         try:
-            table = self.query_one("#all-table", DataTable)
+            table = self._all_table
             logger.debug("Got all-table widget")
             
             # Always save current cursor position before clearing
@@ -1022,89 +1071,56 @@ class CarapaceTUI(App):
                 table.add_column("Name", key="name", width=25)
                 table.add_column("Tags", key="tags", width=8)
                 table.add_column("Description", key="description")  # No width = use remaining space
-            else:
-                # If columns exist, just clear the rows
-                logger.debug(f"Columns exist, clearing {table.row_count} rows")
-                table.clear(columns=False)  # Clear rows only, keep columns
-            
+
             # Use current filter
             filter_text = self.current_filter
             logger.debug(f"Filtering with: '{filter_text}'")
             
-            # Helper function to check if URL is problematic
-            def is_problematic_url(url):
-                """Check if URL is non-standard or problematic"""
-                if not url:
-                    return True  # No URL is problematic
-                
-                url_lower = url.lower()
-                
-                # Standard patterns for good URLs
-                standard_patterns = [
-                    r'^https?://github\.com/[\w\-]+/[\w\-]+/?$',
-                    r'^https?://gitlab\.com/[\w\-]+/[\w\-]+/?$',
-                    r'^https?://bitbucket\.org/[\w\-]+/[\w\-]+/?$',
-                    # Also allow /tree/branch-name for specific branches
-                    r'^https?://github\.com/[\w\-]+/[\w\-]+/tree/[\w\-\.]+/?$',
-                    r'^https?://gitlab\.com/[\w\-]+/[\w\-]+/tree/[\w\-\.]+/?$',
-                ]
-                
-                import re
-                for pattern in standard_patterns:
-                    if re.match(pattern, url_lower):
-                        return False  # URL matches standard pattern
-                
-                # Check for problematic patterns
-                if any(x in url_lower for x in ['.zip', '.rar', '.7z', '/download/', '/releases/', '/wiki/', '/blob/']):
-                    return True
-                
-                # URLs with extra path segments or query params (but allow /tree/)
-                if '?' in url or '#' in url:
-                    return True
-                
-                # Check if it's a tree URL that didn't match our patterns (might have unusual branch name)
-                if '/tree/' in url_lower and ('github.com' in url_lower or 'gitlab.com' in url_lower):
-                    return False  # Allow any tree URL on GitHub/GitLab
-                
-                # Check segment count (but be more lenient)
-                if url.count('/') > 5:  # Changed from 4 to 5 to allow /tree/branch
-                    return True
-                
-                return True  # Default to problematic if not standard
-            
-            # Separate marked and unmarked addons
-            marked_addons = []
-            unmarked_addons = []
-            
-            for addon in self.all_addons:
-                # Apply debug filter if active
+            cache_key = (self._all_addons_ver, filter_text)
+            cached = self._filter_cache.get(cache_key)
+            if cached is not None:
+                self._filter_cache.move_to_end(cache_key)
+                marked_addons, unmarked_addons = cached
+            else:
+                # Apply the debug URL filter up front (rarely active) so the
+                # common per-row loop below carries no dead classifier branch
                 if self.debug_url_filter:
-                    repo_url = addon.get('repo_url', '')
-                    if not is_problematic_url(repo_url):
-                        continue  # Skip addons with good URLs in debug mode
-                
-                is_marked = addon['name'] in self.marked_addons
-                
-                # Marked addons are NEVER filtered out
-                if is_marked:
-                    marked_addons.append(addon)
-                # Only filter unmarked addons
-                elif not filter_text or filter_text in addon['name'].lower() or filter_text in addon['description'].lower():
-                    unmarked_addons.append(addon)
-            
-            # Add marked addons first (at the top)
-            rows_added = 0
-            from rich.text import Text
-            
-            # First add all marked addons
+                    addons = [a for a in self.all_addons
+                              if _is_problematic_url(a.get('repo_url', ''))]
+                else:
+                    addons = self.all_addons
+
+                # Separate marked and unmarked addons
+                marked_addons = []
+                unmarked_addons = []
+
+                for addon in addons:
+                    is_marked = addon['name'] in self.marked_addons
+
+                    # Marked addons are NEVER filtered out
+                    if is_marked:
+                        marked_addons.append(addon)
+                    # Only filter unmarked addons
+                    elif not filter_text or filter_text in addon['name_lower'] or filter_text in addon['description_lower']:
+                        unmarked_addons.append(addon)
+
+                self._filter_cache[cache_key] = (marked_addons, unmarked_addons)
+                if len(self._filter_cache) > 32:
+                    self._filter_cache.popitem(last=False)
+            
+            # Compute the desired per-row state first (marked addons at
+            # the top), then reconcile the table against it
+            ordered_keys = []
+            new_state = {}
+
             for addon in marked_addons:
-                addon_key = addon['name'].lower()
-                is_installed = addon_key in self.installed_addons
-                
+                # One dict probe covers both the membership test and the
+                # enabled lookup
+                addon_info = self.installed_addons.get(addon['name_lower'])
+
                 # Marked addons show different icons based on state
-                if is_installed:
-                    addon_info = self.installed_addons.get(addon_key)
-                    if addon_info and addon_info.get('enabled') == 0:
+                if addon_info is not None:
+                    if addon_info.get('enabled') == 0:
                         status_icon = "◇"  # Marked + Disabled (hollow diamond)
                         status_style = "dim cyan"
                     else:
@@ -1113,37 +1129,20 @@ class CarapaceTUI(App):
                 else:
                     status_icon = "◆"  # Marked + Not installed
                     status_style = "bold cyan"
-                
-                # Format tags as icons
-                tag_icons = self.format_tag_icons(addon.get('tags', []))
-                
-                # Get full description
-                desc = addon['description']
-                
-                status_text = Text(status_icon, style=status_style)
-                desc_text = Text(desc, style="dim")
-                
-                table.add_row(
-                    status_text,
-                    addon['name'],
-                    tag_icons,
-                    desc_text,
-                    key=addon['name']
-                )
-                rows_added += 1
-            
-            # Then add unmarked addons
+
+                ordered_keys.append(addon['name'])
+                new_state[addon['name']] = (status_icon, status_style,
+                                            tuple(addon.get('tags', ())),
+                                            addon['description'])
+
             for addon in unmarked_addons:
-                # Check if installed and enabled state
-                addon_key = addon['name'].lower()
-                is_installed = addon_key in self.installed_addons
+                # Check if installed and enabled state with a single probe
+                addon_info = self.installed_addons.get(addon['name_lower'])
                 status = addon.get('status', 'available')
-                
+
                 # Status icon for unmarked addons
-                if is_installed:
-                    # Check if addon is enabled or disabled
-                    addon_info = self.installed_addons.get(addon_key)
-                    if addon_info and addon_info.get('enabled') == 0:
+                if addon_info is not None:
+                    if addon_info.get('enabled') == 0:
                         status_icon = "○"  # Disabled (empty circle)
                         status_style = "dim"
                     else:
@@ -1158,57 +1157,58 @@ class CarapaceTUI(App):
                 else:
                     status_icon = "·"  # Available
                     status_style = "dim"
-                
-                # Format tags as icons
-                tag_icons = self.format_tag_icons(addon.get('tags', []))
-                
-                # Get full description
-                desc = addon['description']
-                
-                status_text = Text(status_icon, style=status_style)
-                desc_text = Text(desc, style="dim")
-                
-                table.add_row(
-                    status_text,
-                    addon['name'],
-                    tag_icons,
-                    desc_text,
-                    key=addon['name']
-                )
-                rows_added += 1
-            
+
+                ordered_keys.append(addon['name'])
+                new_state[addon['name']] = (status_icon, status_style,
+                                            tuple(addon.get('tags', ())),
+                                            addon['description'])
+
+            def build_row(key):
+                status_icon, status_style, tags, desc = new_state[key]
+                return (_STATUS_CELLS[(status_icon, status_style)],
+                        key,
+                        self.format_tag_icons(tags),
+                        Text(desc, style="dim"))
+
+            old_keys, old_state = self._all_table_state
+            # Hold repaints until the table and counter are both updated
+            # so a rebuild paints once instead of per mutation
+            with self.batch_update():
+                self._apply_table_diff(table, self._ALL_COLUMNS, ordered_keys,
+                                       new_state, old_keys, old_state, build_row)
+                self._all_table_state = (ordered_keys, new_state)
+
+                # Restore cursor position
+                try:
+                    table.cursor_coordinate = saved_cursor
+                    logger.debug(f"Restored cursor to: {saved_cursor}")
+                except Exception as e:
+                    logger.warning(f"Failed to restore cursor: {e}")
+
+                # Update the counter; query() yields nothing before the
+                # widget is mounted, so no exception-swallowing guard is
+                # needed
+                for counter in self.query("#addon-counter").results(Static):
+                    total = len(self.all_addons)
+                    shown = len(marked_addons) + len(unmarked_addons)
+
+                    # Add marked count if any
+                    if self.marked_addons:
+                        counter.update(f"{shown}/{total} ([bold cyan]{len(self._marked_keys())}✓[/bold cyan])")
+                    else:
+                        counter.update(f"{shown}/{total}")
+
             filtered_count = len(self.all_addons) - len(marked_addons) - len(unmarked_addons)
-            logger.info(f"Added {rows_added} rows to all-table (marked: {len(marked_addons)}, filtered out: {filtered_count})")
+            logger.info(f"Showing {len(ordered_keys)} rows in all-table (marked: {len(marked_addons)}, filtered out: {filtered_count})")
             logger.debug(f"Table now has {table.row_count} rows and {len(table.columns)} columns")
             logger.debug(f"Table columns: {[col.label for col in table.columns.values()]}")
-            
-            # Restore cursor position
-            try:
-                table.cursor_coordinate = saved_cursor
-                logger.debug(f"Restored cursor to: {saved_cursor}")
-            except Exception as e:
-                logger.warning(f"Failed to restore cursor: {e}")
-            
-            # Update the counter
-            try:
-                counter = self.query_one("#addon-counter", Static)
-                total = len(self.all_addons)
-                shown = len(marked_addons) + len(unmarked_addons)
-                
-                # Add marked count if any
-                if self.marked_addons:
-                    counter.update(f"{shown}/{total} ([bold cyan]{len(self.marked_addons)}✓[/bold cyan])")
-                else:
-                    counter.update(f"{shown}/{total}")
-            except:
-                pass  # Counter might not exist yet
-            
+
         except Exception as e:
             logger.error(f"Error updating all table: {e}", exc_info=True)
     
     def update_installed_table(self) -> None:
         """Update the installed addons table"""
-        table = self.query_one("#installed-table", DataTable)
+        table = self._installed_table
         
         # Always save current cursor position before clearing
         saved_cursor = table.cursor_coordinate
@@ -1222,10 +1222,7 @@ class CarapaceTUI(App):
             table.add_column("Version", key="version", width=10)
             table.add_column("Tags", key="tags", width=8)
             table.add_column("Description", key="description")  # No width = use remaining space
-        else:
-            # If columns exist, just clear the rows
-            table.clear(columns=False)  # Clear rows only, keep columns
-        
+
         # Use current filter
         filter_text = self.current_filter
         
@@ -1239,110 +1236,83 @@ class CarapaceTUI(App):
             # Marked addons are NEVER filtered
             if is_marked:
                 marked_installed.append((addon_key, addon))
-            # Only filter unmarked addons
-            elif not filter_text or filter_text in addon['name'].lower():
+            # Only filter unmarked addons (keys are already lowercase)
+            elif not filter_text or filter_text in addon_key:
                 unmarked_installed.append((addon_key, addon))
         
-        from rich.text import Text
-        
-        # Add marked addons first
-        for addon_key, addon in marked_installed:
-            # Format folder
-            folder = Path(addon['path']).name if addon['path'] else 'Unknown'
-            
-            # Get addon details from all_addons
-            addon_details = None
-            for a in self.all_addons:
-                if a['name'].lower() == addon_key:
-                    addon_details = a
-                    break
-            
-            # Format tags as icons
-            tags = addon_details.get('tags', []) if addon_details else []
-            tag_icons = self.format_tag_icons(tags)
-            
-            # Get full description
-            desc = addon_details.get('description', '') if addon_details else ''
-            desc_text = Text(desc, style="dim")
-            
-            # Marked status icon - show if disabled
-            if addon.get('enabled') == 0:
-                status_text = Text("◇", style="dim cyan")  # Marked + Disabled
-            else:
-                status_text = Text("◆", style="bold cyan")  # Marked + Enabled
-            
-            table.add_row(
-                status_text,
-                addon['name'],
-                folder,
-                addon['version'] or 'Unknown',
-                tag_icons,
-                desc_text,
-                key=addon['name']
-            )
-        
-        # Add unmarked addons
-        for addon_key, addon in unmarked_installed:
-            # Format folder
-            folder = Path(addon['path']).name if addon['path'] else 'Unknown'
-            
-            # Get addon details from all_addons
-            addon_details = None
-            for a in self.all_addons:
-                if a['name'].lower() == addon_key:
-                    addon_details = a
-                    break
-            
-            # Format tags as icons
-            tags = addon_details.get('tags', []) if addon_details else []
-            tag_icons = self.format_tag_icons(tags)
-            
-            # Get full description
-            desc = addon_details.get('description', '') if addon_details else ''
-            desc_text = Text(desc, style="dim")
-            
-            # Status icon for unmarked installed addons
-            if addon.get('enabled') == 0:
-                status_text = Text("○", style="dim")  # Disabled
-            else:
-                status_text = Text("✓", style="green")  # Enabled
-            
-            table.add_row(
-                status_text,
-                addon['name'],
-                folder,
-                addon['version'] or 'Unknown',
-                tag_icons,
-                desc_text,
-                key=addon['name']
-            )
-        
-        # Restore cursor position
-        try:
-            table.cursor_coordinate = saved_cursor
-            logger.debug(f"Restored cursor to: {saved_cursor}")
-        except Exception as e:
-            # If cursor position is invalid (e.g., fewer rows now), just log it
-            logger.warning(f"Failed to restore cursor in installed table: {e}")
-        
-        # Update the counter
-        try:
-            counter = self.query_one("#installed-counter", Static)
-            total = len(self.installed_addons)
-            shown = len(marked_installed) + len(unmarked_installed)
-            
-            # Add marked count if any
-            if self.marked_addons:
-                # Filter to only show marked count for installed addons
-                marked_count = len([a for a in self.marked_addons if a.lower() in self.installed_addons])
-                if marked_count > 0:
-                    counter.update(f"{shown}/{total} ([bold cyan]{marked_count}✓[/bold cyan])")
+        # Compute the desired per-row state (marked addons first), then
+        # reconcile the table against it
+        ordered_keys = []
+        new_state = {}
+
+        for marked, entries in ((True, marked_installed), (False, unmarked_installed)):
+            for addon_key, addon in entries:
+                # Get addon details from all_addons
+                addon_details = self._all_by_key.get(addon_key)
+
+                tags = addon_details.get('tags', []) if addon_details else []
+                desc = addon_details.get('description', '') if addon_details else ''
+
+                # Status icon - marked vs plain, showing disabled state
+                if marked:
+                    if addon.get('enabled') == 0:
+                        status_icon, status_style = "◇", "dim cyan"  # Marked + Disabled
+                    else:
+                        status_icon, status_style = "◆", "bold cyan"  # Marked + Enabled
+                else:
+                    if addon.get('enabled') == 0:
+                        status_icon, status_style = "○", "dim"  # Disabled
+                    else:
+                        status_icon, status_style = "✓", "green"  # Enabled
+
+                ordered_keys.append(addon['name'])
+                new_state[addon['name']] = (status_icon, status_style,
+                                            addon['_folder'], addon['_version_str'],
+                                            tuple(tags), desc)
+
+        def build_row(key):
+            status_icon, status_style, folder, version, tags, desc = new_state[key]
+            return (_STATUS_CELLS[(status_icon, status_style)],
+                    key,
+                    folder,
+                    version,
+                    self.format_tag_icons(tags),
+                    Text(desc, style="dim"))
+
+        old_keys, old_state = self._installed_table_state
+        # Hold repaints until the table and counter are both updated so a
+        # rebuild paints once instead of per mutation
+        with self.batch_update():
+            self._apply_table_diff(table, self._INSTALLED_COLUMNS, ordered_keys,
+                                   new_state, old_keys, old_state, build_row)
+            self._installed_table_state = (ordered_keys, new_state)
+
+            # Restore cursor position
+            try:
+                table.cursor_coordinate = saved_cursor
+                logger.debug(f"Restored cursor to: {saved_cursor}")
+            except Exception as e:
+                # If cursor position is invalid (e.g., fewer rows now), just log it
+                logger.warning(f"Failed to restore cursor in installed table: {e}")
+
+            # Update the counter; query() yields nothing before the widget
+            # is mounted, so no exception-swallowing guard is needed
+            for counter in self.query("#installed-counter").results(Static):
+                total = len(self.installed_addons)
+                shown = len(marked_installed) + len(unmarked_installed)
+
+                # Add marked count if any
+                if self.marked_addons:
+                    # Filter to only show marked count for installed addons;
+                    # lowercase the marks once instead of per comparison
+                    marked_lc = {m.lower() for m in self.marked_addons}
+                    marked_count = sum(1 for m in marked_lc if m in self.installed_addons)
+                    if marked_count > 0:
+                        counter.update(f"{shown}/{total} ([bold cyan]{marked_count}✓[/bold cyan])")
+                    else:
+                        counter.update(f"{shown}/{total}")
                 else:
                     counter.update(f"{shown}/{total}")
-            else:
-                counter.update(f"{shown}/{total}")
-        except:
-            pass  # Counter might not exist yet
     
     def update_broken_table(self, broken_addons) -> None:
         """Update the broken addons table"""
@@ -1370,22 +1340,38 @@ class CarapaceTUI(App):
     def on_input_changed(self, event: Input.Changed) -> None:
         """Handle search input changes - live fuzzy search"""
         logger.debug(f"Input changed: {event.input.id} = '{event.value}'")
+        if event.input.id not in ("search-all", "search-installed"):
+            return
+
+        self.current_filter = event.value.lower()
+        logger.debug(f"Setting filter to: '{self.current_filter}'")
+
+        # Trailing-edge debounce: a burst of keystrokes triggers one
+        # table rebuild for the final value, not one per character
+        if self._filter_timer is not None:
+            self._filter_timer.stop()
         if event.input.id == "search-all":
-            self.current_filter = event.value.lower()
-            logger.debug(f"Setting filter to: '{self.current_filter}'")
-            self.update_all_table()
-        elif event.input.id == "search-installed":
-            self.current_filter = event.value.lower()
-            logger.debug(f"Setting filter to: '{self.current_filter}'")
-            self.update_installed_table()
+            self._filter_timer = self.set_timer(0.08, self._apply_filter_all)
+        else:
+            self._filter_timer = self.set_timer(0.08, self._apply_filter_installed)
+
+    def _apply_filter_all(self) -> None:
+        """Apply the debounced filter to the all addons table"""
+        self._filter_timer = None
+        self.update_all_table()
+
+    def _apply_filter_installed(self) -> None:
+        """Apply the debounced filter to the installed table"""
+        self._filter_timer = None
+        self.update_installed_table()
     
     def on_input_submitted(self, event: Input.Submitted) -> None:
         """Handle search input submission - focus table"""
         if event.input.id == "search-all":
-            table = self.query_one("#all-table", DataTable)
+            table = self._all_table
             table.focus()
         elif event.input.id == "search-installed":
-            table = self.query_one("#installed-table", DataTable)
+            table = self._installed_table
             table.focus()
     
     def on_key(self, event) -> None:
@@ -1400,7 +1386,7 @@ class CarapaceTUI(App):
             if event.key in ("down", "up"):
                 # Move focus to the table and handle navigation
                 if focused.id == "search-all":
-                    table = self.query_one("#all-table", DataTable)
+                    table = self._all_table
                     table.focus()
                     if event.key == "down":
                         table.action_cursor_down()
@@ -1408,7 +1394,7 @@ class CarapaceTUI(App):
                         table.action_cursor_up()
                     event.prevent_default()
                 elif focused.id == "search-installed":
-                    table = self.query_one("#installed-table", DataTable)
+                    table = self._installed_table
                     table.focus()
                     if event.key == "down":
                         table.action_cursor_down()
@@ -1427,22 +1413,16 @@ class CarapaceTUI(App):
             # Auto-focus search on letter keys if not in an input
             if event.key and len(event.key) == 1 and event.key.isalpha():
                 # Get the active tab's search input
-                try:
-                    tabbed = self.query_one(TabbedContent)
-                    active_tab = tabbed.active
-                    
-                    if active_tab == "all-tab":
-                        search = self.query_one("#search-all", Input)
-                    else:
-                        search = self.query_one("#search-installed", Input)
-                    
-                    # Focus the search and add the character
-                    search.focus()
-                    # Use call_after_refresh to ensure focus completes before adding text
-                    self.call_after_refresh(lambda: self._append_to_search(search, event.key))
-                    event.prevent_default()
-                except:
-                    pass
+                if self._tabbed.active == "all-tab":
+                    search = self._search_all
+                else:
+                    search = self._search_installed
+
+                # Focus the search and add the character
+                search.focus()
+                # Use call_after_refresh to ensure focus completes before adding text
+                self.call_after_refresh(lambda: self._append_to_search(search, event.key))
+                event.prevent_default()
     
     def on_mouse_down(self, event) -> None:
         """Handle mouse down - track which button was pressed"""
@@ -1452,18 +1432,18 @@ class CarapaceTUI(App):
             self._addon_before_click = self.selected_addon
             # Set a flag that we have a pending right-click mark
             self._pending_right_click_mark = True
-            # Schedule a check after the click processes with a small delay
-            self.set_timer(0.1, self._check_right_click_same_row)
-    
-    def _check_right_click_same_row(self) -> None:
-        """Check if right-click was on the same row that was already highlighted"""
-        if hasattr(self, '_pending_right_click_mark') and self._pending_right_click_mark:
+            # A right-click on the already-highlighted row fires no
+            # RowHighlighted event, so resolve the mark right after the
+            # click finishes processing instead of on a 100ms timer
+            self.call_after_refresh(self._resolve_right_click_mark)
+
+    def _resolve_right_click_mark(self) -> None:
+        """Mark the row under a right-click that didn't move the cursor"""
+        if self._pending_right_click_mark:
             self._pending_right_click_mark = False  # Always clear the flag
-            # Check if we're still on the same row (no row_highlighted event fired)
-            if hasattr(self, '_addon_before_click') and self._addon_before_click == self.selected_addon:
-                # Same row was clicked, mark/unmark it now
-                if self.selected_addon:
-                    self.action_mark()
+            # Still on the same row: no row_highlighted event fired
+            if self._addon_before_click == self.selected_addon and self.selected_addon:
+                self.action_mark()
     
     def _append_to_search(self, search_input: Input, char: str) -> None:
         """Append a character to the search input after focus"""
@@ -1477,7 +1457,7 @@ class CarapaceTUI(App):
         logger.debug(f"Selected addon: {self.selected_addon}")
         
         # Check if this was triggered by a right-click (we set a flag)
-        if hasattr(self, '_pending_right_click_mark') and self._pending_right_click_mark:
+        if self._pending_right_click_mark:
             self._pending_right_click_mark = False
             # Always mark on right-click, whether row changed or not
             if self.selected_addon:
@@ -1499,19 +1479,11 @@ class CarapaceTUI(App):
         logger.debug(f"Tab activated: {event.pane.id}")
         # Always focus the DataTable in the activated tab
         if event.pane.id == "all-tab":
-            try:
-                table = self.query_one("#all-table", DataTable)
-                table.focus()
-                logger.debug("Focused all-table after tab switch")
-            except:
-                pass
+            self._all_table.focus()
+            logger.debug("Focused all-table after tab switch")
         elif event.pane.id == "installed-tab":
-            try:
-                table = self.query_one("#installed-table", DataTable)
-                table.focus()
-                logger.debug("Focused installed-table after tab switch")
-            except:
-                pass
+            self._installed_table.focus()
+            logger.debug("Focused installed-table after tab switch")
     
     
     @work(thread=True)
@@ -1531,11 +1503,8 @@ class CarapaceTUI(App):
             self.call_from_thread(self.notify, f"Installing {len(to_install)} addons...", timeout=None)
         
         # Install each addon
-        from carapace.db import Database
-        from carapace.installer import AddonInstaller
         
-        db = Database()
-        installer = AddonInstaller(db)
+        installer = self._worker_installer()
         success_count = 0
         failed = []
         
@@ -1549,14 +1518,12 @@ class CarapaceTUI(App):
             else:
                 failed.append(addon_name)
         
-        db.close()
         
         # Clear marks after installation
-        self.marked_addons.clear()
+        self._clear_marks()
         
         # Reload data
-        self.load_installed_addons()
-        self.load_all_addons()  # Refresh to update status
+        self.load_state()
         
         # Notify results
         if success_count > 0:
@@ -1576,10 +1543,8 @@ class CarapaceTUI(App):
         # Show progress modal
         self.call_from_thread(self.show_progress_modal, "Updating", f"Updating {self.selected_addon}...")
         
-        db = Database()
-        installer = AddonInstaller(db)
+        installer = self._worker_installer()
         success = installer.update_addon(self.selected_addon)
-        db.close()
         
         # Dismiss modal
         self.call_from_thread(self.dismiss_progress_modal)
@@ -1606,8 +1571,7 @@ class CarapaceTUI(App):
         else:
             self.call_from_thread(self.show_progress_modal, "Uninstalling", f"Uninstalling {len(to_uninstall)} addons...")
         
-        db = Database()
-        installer = AddonInstaller(db)
+        installer = self._worker_installer()
         success_count = 0
         failed = []
         
@@ -1618,22 +1582,20 @@ class CarapaceTUI(App):
             if installer.remove_addon(addon_name):
                 success_count += 1
                 # Remove from marked addons after successful uninstall
-                self.marked_addons.discard(addon_name)
+                self._unmark(addon_name)
             else:
                 failed.append(addon_name)
         
-        db.close()
         
         # Dismiss modal
         self.call_from_thread(self.dismiss_progress_modal)
         
         # Clear marked addons if batch uninstall
         if len(to_uninstall) > 1:
-            self.marked_addons.clear()
+            self._clear_marks()
         
         # Reload data
-        self.load_installed_addons()
-        self.load_all_addons()  # Refresh to update status
+        self.load_state()
         
         # Notify results
         if success_count > 0:
@@ -1651,8 +1613,6 @@ class CarapaceTUI(App):
         self.call_from_thread(self.notify, "Checking wiki for updates...", timeout=None)
         
         try:
-            import requests
-            
             # Use MediaWiki API to check revision efficiently
             api_url = 'https://turtle-wow.fandom.com/api.php'
             params = {
@@ -1662,10 +1622,30 @@ class CarapaceTUI(App):
                 'rvprop': 'ids|timestamp',
                 'format': 'json'
             }
-            
-            response = requests.get(api_url, params=params, timeout=10)
+
+            db = self._worker_db()
+            cursor = db.conn.cursor()
+
+            # Stored revision and ETag from the last successful sync
+            cursor.execute("SELECT value FROM settings WHERE key = 'wiki_revision'")
+            stored = cursor.fetchone()
+            stored_revision = stored['value'] if stored else None
+            cursor.execute("SELECT value FROM settings WHERE key = 'wiki_etag'")
+            stored = cursor.fetchone()
+            stored_etag = stored['value'] if stored else None
+
+            # Conditional request: a 304 answers the no-change case
+            # without any JSON body to download or decode
+            headers = {'If-None-Match': stored_etag} if stored_etag else None
+            response = self.http.get(api_url, params=params, headers=headers, timeout=10)
+
+            if response.status_code == 304:
+                self.call_from_thread(self.notify, "Wiki has not changed, skipping sync", severity="information")
+                return
+
+            current_etag = response.headers.get('ETag')
             data = response.json()
-            
+
             # Extract revision info
             current_revision = None
             pages = data.get('query', {}).get('pages', {})
@@ -1674,89 +1654,92 @@ class CarapaceTUI(App):
                 if revisions:
                     current_revision = str(revisions[0].get('revid'))
                     break
-            
+
             if not current_revision:
                 self.call_from_thread(self.notify, "Could not get wiki revision", severity="warning")
-            
-            # Check stored revision
-            db = Database()
-            cursor = db.conn.cursor()
-            cursor.execute("SELECT value FROM settings WHERE key = 'wiki_revision'")
-            stored = cursor.fetchone()
-            stored_revision = stored['value'] if stored else None
-            
+
             if current_revision and current_revision == stored_revision:
                 self.call_from_thread(self.notify, "Wiki has not changed, skipping sync", severity="information")
-                db.close()
                 return
-            
+
             # Parse wiki
             self.call_from_thread(self.notify, "Fetching addon list from wiki...", timeout=None)
             addons = self.parser.parse_from_url()
-            
+
             # Save to database - but preserve manual edits
             self.call_from_thread(self.notify, f"Updating database with {len(addons)} addons...", timeout=None)
-            db = Database()
-            cursor = db.conn.cursor()
-            count = 0
-            
+            # Load every existing row once and do the manual-edit merge in
+            # Python, instead of two SELECTs per parsed addon
+            cursor.execute("""
+                SELECT name, override_url, repo_url, description, tags
+                FROM addons
+                WHERE deleted_at_utc IS NULL
+            """)
+            existing_rows = {row['name']: row for row in cursor.fetchall()}
+
+            now = datetime.utcnow().isoformat()
+            tag_updates = []  # (tags_json, now, name) rows for manually-edited addons
+            to_upsert = []
+
             for addon in addons:
-                # Check if this addon has been manually edited
-                cursor.execute("""
-                    SELECT name, override_url, repo_url, description 
-                    FROM addons 
-                    WHERE name = ? AND deleted_at_utc IS NULL
-                """, (addon['name'],))
-                existing = cursor.fetchone()
-                
-                if existing and existing['override_url']:
+                existing = existing_rows.get(addon['name'])
+
+                if existing is not None and existing['override_url']:
                     # Has override URL - only update tags, preserve everything else
-                    import json
-                    old_tags = []
-                    cursor.execute("SELECT tags FROM addons WHERE name = ?", (addon['name'],))
-                    tags_row = cursor.fetchone()
-                    if tags_row and tags_row['tags']:
-                        old_tags = json.loads(tags_row['tags'])
-                    
-                    # Merge tags
-                    new_tags = addon.get('tags', [])
-                    merged_tags = list(set(old_tags + new_tags))
-                    
-                    cursor.execute("""
-                        UPDATE addons 
-                        SET tags = ?, updated_at_utc = ?
-                        WHERE name = ? AND deleted_at_utc IS NULL
-                    """, (json.dumps(merged_tags), datetime.utcnow().isoformat(), addon['name']))
+                    old_tags = json_loads(existing['tags']) if existing['tags'] else []
+
+                    # Merge tags; sorted gives a stable serialization, so
+                    # an unchanged merge can skip the write entirely
+                    merged_tags = sorted({*old_tags, *addon.get('tags', [])})
+                    merged_json = json_dumps(merged_tags)
+                    if merged_json != existing['tags']:
+                        tag_updates.append((merged_json, now, addon['name']))
                 else:
-                    # No manual edits - normal upsert
-                    addon_data = {
+                    # No manual edits - normal upsert, skipped when every
+                    # field the upsert writes is already identical so an
+                    # unchanged wiki row costs no page dirtying at all
+                    if (existing is not None
+                            and existing['repo_url'] == addon.get('repo_url', '')
+                            and existing['description'] == addon.get('description', '')
+                            and existing['tags'] == json_dumps(addon.get('tags', []))):
+                        continue
+                    to_upsert.append({
                         'name': addon['name'],
                         'description': addon.get('description', ''),
                         'homepage_url': addon.get('url', ''),
                         'repo_url': addon.get('repo_url', ''),
                         'tags': addon.get('tags', []),
                         'status': addon.get('status', 'available')
-                    }
-                    db.upsert_addon(addon_data)
-                
-                count += 1
-                # Update progress every 50 addons
-                if count % 50 == 0:
-                    self.call_from_thread(self.notify, f"Processing addons... {count}/{len(addons)}", timeout=None)
-            
-            db.conn.commit()
-            
-            # Save the revision ID if we have it
-            if current_revision:
-                cursor.execute("DELETE FROM settings WHERE key = 'wiki_revision'")
-                cursor.execute("INSERT INTO settings (key, value) VALUES ('wiki_revision', ?)", (current_revision,))
-                db.conn.commit()
-            
-            db.close()
-            
+                    })
+
+            # One explicit transaction for the whole merge: per-row
+            # commits each cost an fsync, so batching them is the bulk
+            # of the sync speedup on large wiki pages
+            with db.conn:
+                if tag_updates:
+                    cursor.executemany("""
+                        UPDATE addons
+                        SET tags = ?, updated_at_utc = ?
+                        WHERE name = ? AND deleted_at_utc IS NULL
+                    """, tag_updates)
+
+                if to_upsert:
+                    db.upsert_addons_many(to_upsert)
+
+                # Save the revision ID and ETag if we have them, inside the
+                # same transaction so a failed sync never records them
+                if current_revision:
+                    cursor.execute("DELETE FROM settings WHERE key = 'wiki_revision'")
+                    cursor.execute("INSERT INTO settings (key, value) VALUES ('wiki_revision', ?)", (current_revision,))
+                if current_etag:
+                    cursor.execute("INSERT OR REPLACE INTO settings (key, value) VALUES ('wiki_etag', ?)", (current_etag,))
+
+            # Cached installers must rebuild their repo-URL caches now
+            # that the catalogue has changed
+            self._installer_gen += 1
+
             # Reload data
-            self.load_all_addons()
-            self.load_installed_addons()
+            self.load_state()
             
             self.call_from_thread(self.notify, f"✓ Wiki sync complete - {len(addons)} addons", severity="information", timeout=5)
         except Exception as e:
@@ -1765,10 +1748,8 @@ class CarapaceTUI(App):
     @work(thread=True)
     def check_for_updates(self) -> None:
         """Check for addon updates"""
-        db = Database()
-        installer = AddonInstaller(db)
+        installer = self._worker_installer()
         updates = installer.check_for_updates()
-        db.close()
         
         if updates:
             msg = f"Updates available for: {', '.join([u['name'] for u in updates])}"
@@ -1797,8 +1778,29 @@ class CarapaceTUI(App):
                 installed_info = self.installed_addons.get(self.selected_addon.lower(), {})
                 addon_data['version'] = installed_info.get('version', 'Unknown')
                 addon_data['path'] = installed_info.get('path', '')
-            
-            self.push_screen(AddonDetailsScreen(self.selected_addon, addon_data))
+
+            # Reuse the installed screen when the same addon is reopened
+            # with unchanged data, so Details -> Back -> Details doesn't
+            # recompose the whole read-only view
+            key = f"details-{self.selected_addon}"
+            cached = self._details_cache.get(key)
+            if cached == addon_data:
+                self._details_cache.move_to_end(key)
+                self.push_screen(key)
+                return
+            if cached is not None:
+                self.uninstall_screen(key)
+                del self._details_cache[key]
+
+            self.install_screen(AddonDetailsScreen(self.selected_addon, addon_data), name=key)
+            self._details_cache[key] = addon_data
+
+            # Keep only the eight most recently viewed addons installed
+            while len(self._details_cache) > 8:
+                evicted, _ = self._details_cache.popitem(last=False)
+                self.uninstall_screen(evicted)
+
+            self.push_screen(key)
         else:
             self.notify(f"Could not find details for {self.selected_addon}", severity="error")
     
@@ -1809,8 +1811,7 @@ class CarapaceTUI(App):
             return
         
         # Get full addon data from database
-        from carapace.db import Database
-        db = Database()
+        db = self._worker_db()
         cursor = db.conn.cursor()
         cursor.execute("""
             SELECT name, description, homepage_url, repo_url, override_url, status, tags
@@ -1819,7 +1820,6 @@ class CarapaceTUI(App):
         """, (self.selected_addon,))
         
         row = cursor.fetchone()
-        db.close()
         
         if row:
             addon_data = {
@@ -1829,7 +1829,7 @@ class CarapaceTUI(App):
                 'repo_url': row['repo_url'] or '',
                 'override_url': row['override_url'] or '',
                 'status': row['status'] or 'available',
-                'tags': json.loads(row['tags']) if row['tags'] else []
+                'tags': json_loads(row['tags']) if row['tags'] else []
             }
             self.push_screen(EditAddonModal(self.selected_addon, addon_data))
         else:
@@ -1851,23 +1851,16 @@ class CarapaceTUI(App):
             logger.info(f"Forced refresh with {len(self.all_addons)} addons")
         
         # Then reload from database
-        self.load_all_addons()
-        self.load_installed_addons()
+        self.load_state()
         self.notify("Refreshed")
     
     def action_focus_search(self) -> None:
         """Focus search input"""
         # Find active tab and focus its search
-        try:
-            tabbed = self.query_one(TabbedContent)
-            active_tab = tabbed.active
-            
-            if active_tab == "all-tab":
-                self.query_one("#search-all", Input).focus()
-            elif active_tab == "installed-tab":
-                self.query_one("#search-installed", Input).focus()
-        except:
-            pass
+        if self._tabbed.active == "all-tab":
+            self._search_all.focus()
+        elif self._tabbed.active == "installed-tab":
+            self._search_installed.focus()
     
     def action_install(self) -> None:
         """Install selected addon"""
@@ -1894,27 +1887,24 @@ class CarapaceTUI(App):
         if result:
             # Install the addon in a separate worker
             # Use a partial function to bind the addon name
-            from functools import partial
             install_func = partial(self._install_single_addon, self.selected_addon)
             self.run_worker(install_func, name="install_single", thread=True)
     
     def _install_single_addon(self, addon_name: str) -> None:
         """Install a single addon without showing progress modal"""
-        from carapace.db import Database
-        from carapace.installer import AddonInstaller
         
         # Simple notification instead of modal
         self.call_from_thread(self.notify, f"Installing {addon_name}...", timeout=None)
         
-        db = Database()
-        installer = AddonInstaller(db)
+        installer = self._worker_installer()
         
         if installer.install_addon(addon_name):
             self.call_from_thread(self.notify, f"✓ {addon_name} installed successfully")
             # Update installed list synchronously right here
             installer.sync_installed_state()
-            installed = installer.get_installed_addons()
+            installed = self._annotate_installed(installer.get_installed_addons())
             self.installed_addons = installed
+            self._bump_addons_ver()
             logger.info(f"Updated installed_addons, now have {len(self.installed_addons)} installed")
             # Now update the table with the fresh installed list
             self.call_from_thread(self.update_all_table)
@@ -1922,7 +1912,6 @@ class CarapaceTUI(App):
         else:
             self.call_from_thread(self.notify, f"✗ Failed to install {addon_name}", severity="error")
         
-        db.close()
     
     def action_update(self) -> None:
         """Update selected addon"""
@@ -1945,52 +1934,74 @@ class CarapaceTUI(App):
         """Edit selected addon"""
         self.edit_addon()
     
+    def _bump_addons_ver(self) -> None:
+        """Invalidate cached filter results after addon state changes"""
+        self._all_addons_ver += 1
+
+    def _mark(self, name: str) -> None:
+        """Mark an addon and flag the marked-row snapshot stale"""
+        self.marked_addons.add(name)
+        self._marked_dirty = True
+        self._bump_addons_ver()
+
+    def _unmark(self, name: str) -> None:
+        """Unmark an addon and flag the marked-row snapshot stale"""
+        self.marked_addons.discard(name)
+        self._marked_dirty = True
+        self._bump_addons_ver()
+
+    def _clear_marks(self) -> None:
+        """Drop all marks and flag the marked-row snapshot stale"""
+        self.marked_addons.clear()
+        self._marked_dirty = True
+        self._bump_addons_ver()
+
+    def _request_repaint(self) -> None:
+        """Schedule one table repaint for the next refresh cycle
+
+        Mark toggles only change row styling, so back-to-back changes
+        (mark-all in particular) collapse into a single rebuild instead
+        of one per toggled row.
+        """
+        if not self._repaint_pending:
+            self._repaint_pending = True
+            self.call_after_refresh(self._repaint_marked)
+
+    def _repaint_marked(self) -> None:
+        """Run the deferred repaint requested by _request_repaint"""
+        if self._repaint_pending:
+            self._repaint_pending = False
+            self.update_all_table()
+            self.update_installed_table()
+
+    def _marked_keys(self) -> list:
+        """Row keys for marked addons, rebuilt only after mark changes"""
+        if self._marked_dirty:
+            self._marked_row_keys = list(self.marked_addons)
+            self._marked_dirty = False
+        return self._marked_row_keys
+
     def action_mark(self) -> None:
         """Mark/unmark current addon for batch operations"""
         if not self.selected_addon:
             return
-        
+
         if self.selected_addon in self.marked_addons:
-            self.marked_addons.remove(self.selected_addon)
+            self._unmark(self.selected_addon)
         else:
-            self.marked_addons.add(self.selected_addon)
-        
-        # Get the active tab to determine which table to update
-        try:
-            tabbed = self.query_one(TabbedContent)
-            active_tab = tabbed.active
-            
-            if active_tab == "all-tab":
-                table = self.query_one("#all-table", DataTable)
-                current_coord = table.cursor_coordinate
-                self.update_all_table()
-            else:
-                table = self.query_one("#installed-table", DataTable)
-                current_coord = table.cursor_coordinate
-                self.update_installed_table()
-            
-            # Restore cursor position after update
-            if current_coord:
-                try:
-                    table.cursor_coordinate = current_coord
-                except:
-                    pass  # If the row doesn't exist anymore, just ignore
-        except:
-            pass
+            self._mark(self.selected_addon)
+
+        # Repaint once on the next refresh cycle; the table updates
+        # already preserve the cursor themselves
+        self._request_repaint()
     
     def action_select(self) -> None:
         """Handle enter key on selected item"""
         # Get active tab
-        try:
-            tabbed = self.query_one(TabbedContent)
-            active_tab = tabbed.active
-            
-            if active_tab == "all-tab":
-                self.install_selected()
-            elif active_tab == "installed-tab":
-                self.update_selected()
-        except:
-            pass
+        if self._tabbed.active == "all-tab":
+            self.install_selected()
+        elif self._tabbed.active == "installed-tab":
+            self.update_selected()
     
     def action_toggle_enable(self) -> None:
         """Enable or disable selected addon"""
@@ -2007,74 +2018,57 @@ class CarapaceTUI(App):
     
     def disable_addon(self, addon_name: str) -> bool:
         """Disable an addon by removing its junction (keep in .repos)"""
-        from carapace.db import Database
-        import os
-        from pathlib import Path
-        import subprocess
         
-        db = Database()
+        db = self._worker_db()
         cursor = db.conn.cursor()
         
         # Get addon info
-        cursor.execute("""
-            SELECT path FROM installed 
-            WHERE name = ? AND deleted_at_utc IS NULL
-        """, (addon_name,))
-        
+        cursor.execute(_SQL_GET_INSTALLED_PATH, (addon_name,))
+
         addon_row = cursor.fetchone()
         if not addon_row:
-            db.close()
             return False
-        
+
         addon_path = Path(addon_row['path'])
-        
+
         try:
-            # Windows: Remove junction
+            # Windows: Remove junction; a junction is a plain directory to
+            # the POSIX API, so os.rmdir avoids the cmd spawn
             if os.path.islink(addon_path) or os.path.exists(addon_path):
-                subprocess.run(['cmd', '/c', 'rmdir', str(addon_path)], check=False, capture_output=True)
-            
+                try:
+                    os.rmdir(addon_path)
+                except OSError:
+                    subprocess.run(['cmd', '/c', 'rmdir', str(addon_path)], check=False, capture_output=True)
+
             # Update database to mark as disabled
-            cursor.execute("""
-                UPDATE installed 
-                SET enabled = 0 
-                WHERE name = ? AND deleted_at_utc IS NULL
-            """, (addon_name,))
+            cursor.execute(_SQL_SET_ENABLED, (0, addon_name))
             db.conn.commit()
             
             # Update installed list (keys are lowercase)
             addon_key = addon_name.lower()
             if addon_key in self.installed_addons:
                 self.installed_addons[addon_key]['enabled'] = 0
+                self._bump_addons_ver()
             
-            db.close()
             return True
         except Exception as e:
             logger.error(f"Failed to disable {addon_name}: {e}")
-            db.close()
             return False
     
     def enable_addon(self, addon_name: str) -> bool:
         """Enable an addon by creating junction from .repos"""
-        from carapace.db import Database
-        from carapace.installer import AddonInstaller
-        from pathlib import Path
-        import subprocess
         
-        db = Database()
-        installer = AddonInstaller(db)
+        db = self._worker_db()
+        installer = self._worker_installer()
         cursor = db.conn.cursor()
         
         # Get addon info
-        cursor.execute("""
-            SELECT path FROM installed 
-            WHERE name = ? AND deleted_at_utc IS NULL
-        """, (addon_name,))
-        
+        cursor.execute(_SQL_GET_INSTALLED_PATH, (addon_name,))
+
         addon_row = cursor.fetchone()
         if not addon_row:
-            db.close()
             return False
-        
+
         addon_path = Path(addon_row['path'])  # This is the full path like E:\Games\TurtleWoW\Interface\AddOns\Attack
         
         try:
@@ -2082,63 +2076,86 @@ class CarapaceTUI(App):
             repo_folder = installer.addon_path / ".repos" / addon_path.name
             if not repo_folder.exists():
                 logger.error(f"Repository not found for {addon_name} at {repo_folder}")
-                db.close()
                 return False
             
-            # Remove existing path if it exists (might be leftover from disable)
-            if addon_path.exists():
-                # Just use rmdir for junctions, it's simpler and works
-                subprocess.run(['cmd', '/c', 'rmdir', str(addon_path)], check=False, capture_output=True)
-            
             # Create junction from AddOns/AddonName to AddOns/.repos/AddonName
-            # IMPORTANT: addon_path is the target (where junction will be created)
-            #            repo_folder is the source (what the junction points to)
-            subprocess.run(['mklink', '/J', str(addon_path), str(repo_folder)], 
-                         shell=True, check=True, capture_output=True)
+            # via the installer helper: it clears any leftover from disable,
+            # prefers the in-process reparse-point call, and only falls back
+            # to spawning mklink when that is unavailable
+            if not installer._create_junction(repo_folder, addon_path):
+                return False
             
             # Update database to mark as enabled
-            cursor.execute("""
-                UPDATE installed 
-                SET enabled = 1 
-                WHERE name = ? AND deleted_at_utc IS NULL
-            """, (addon_name,))
+            cursor.execute(_SQL_SET_ENABLED, (1, addon_name))
             db.conn.commit()
             
             # Update installed list (keys are lowercase)
             addon_key = addon_name.lower()
             if addon_key in self.installed_addons:
                 self.installed_addons[addon_key]['enabled'] = 1
+                self._bump_addons_ver()
             
-            db.close()
             return True
         except Exception as e:
             logger.error(f"Failed to enable {addon_name}: {e}")
-            db.close()
             return False
     
+    def _toggle_marked_enabled(self) -> None:
+        """Flip the enabled state of every marked installed addon in one batch"""
+        pairs = []
+        for name in self.marked_addons:
+            info = self.installed_addons.get(name.lower())
+            if info is not None:
+                pairs.append((info['name'], info.get('enabled') == 0))
+
+        if not pairs:
+            self.call_from_thread(self.notify, "No marked addons are installed", severity="warning")
+            return
+
+        installer = self._worker_installer()
+        applied = installer.bulk_set_enabled(pairs)
+
+        # Mirror only the flags the installer verified and stored, so a
+        # failed junction never shows as toggled (keys are lowercase)
+        for name, enabled in applied:
+            addon_key = name.lower()
+            if addon_key in self.installed_addons:
+                self.installed_addons[addon_key]['enabled'] = enabled
+        self._bump_addons_ver()
+
+        if len(applied) < len(pairs):
+            self.call_from_thread(
+                self.notify,
+                f"Toggled {len(applied)} of {len(pairs)} addons - see log for failures",
+                severity="warning"
+            )
+        else:
+            self.call_from_thread(self.notify, f"Toggled {len(applied)} addons")
+        self.call_from_thread(self.update_all_table)
+        self.call_from_thread(self.update_installed_table)
+
     @work(thread=True)
     def toggle_addon_enabled(self) -> None:
         """Toggle addon enabled/disabled state"""
-        from carapace.db import Database
-        
-        db = Database()
+
+        # With marked addons, toggle the whole set in one batch instead
+        # of two subprocess spawns per addon
+        if self.marked_addons:
+            self._toggle_marked_enabled()
+            return
+
+        db = self._worker_db()
         cursor = db.conn.cursor()
         
         # Get addon from database to check current state
-        cursor.execute("""
-            SELECT name, enabled 
-            FROM installed 
-            WHERE name = ? AND deleted_at_utc IS NULL
-        """, (self.selected_addon,))
+        cursor.execute(_SQL_GET_INSTALLED_ENABLED, (self.selected_addon,))
         
         addon_row = cursor.fetchone()
         if not addon_row:
-            db.close()
             self.call_from_thread(self.notify, f"{self.selected_addon} is not installed", severity="warning")
             return
         
         is_currently_enabled = addon_row['enabled'] == 1
-        db.close()
         
         # Toggle based on database state
         if is_currently_enabled:
@@ -2160,11 +2177,6 @@ class CarapaceTUI(App):
     
     def action_show_help(self) -> None:
         """Show program info and help"""
-        from textual.widgets import Static
-        from textual.containers import VerticalScroll
-        import platform
-        import sys
-        from pathlib import Path
         
         class HelpModal(ModalScreen):
             """Help dialog showing program info"""
@@ -2277,8 +2289,7 @@ class CarapaceTUI(App):
         addon_count = len(self.installed_addons)
         self.call_from_thread(self.show_progress_modal, "Updating All", f"Updating {addon_count} addons...")
         
-        db = Database()
-        installer = AddonInstaller(db)
+        installer = self._worker_installer()
         success_count = 0
         failed = []
         
@@ -2291,14 +2302,12 @@ class CarapaceTUI(App):
             else:
                 failed.append(addon_name)
         
-        db.close()
         
         # Dismiss progress modal
         self.call_from_thread(self.dismiss_progress_modal)
         
         # Reload data
-        self.load_installed_addons()
-        self.load_all_addons()
+        self.load_state()
         
         # Notify results
         if success_count > 0:
@@ -2311,30 +2320,29 @@ class CarapaceTUI(App):
     
     def action_mark_all(self) -> None:
         """Mark all visible addons"""
-        try:
-            tabbed = self.query_one(TabbedContent)
-            active_tab = tabbed.active
-            
-            if active_tab == "all-tab":
-                table = self.query_one("#all-table", DataTable)
-                # Mark all non-installed addons
-                for row_key in table.rows:
-                    addon_name = str(row_key.value)
-                    if addon_name.lower() not in self.installed_addons:
-                        self.marked_addons.add(addon_name)
-                
-                # Refresh table to show marks
-                self.update_all_table()
-        except:
-            pass
+        if self._tabbed.active == "all-tab":
+            # Mark all visible non-installed addons straight from the
+            # addon list (same filter rules as update_all_table), instead
+            # of dereferencing every Textual row key
+            filter_text = self.current_filter
+            names = {a['name'] for a in self.all_addons
+                     if a['name_lower'] not in self.installed_addons
+                     and (not self.debug_url_filter or _is_problematic_url(a.get('repo_url', '')))
+                     and (not filter_text or filter_text in a['name_lower']
+                          or filter_text in a['description_lower'])}
+
+            if names - self.marked_addons:
+                self.marked_addons |= names
+                self._marked_dirty = True
+                self._bump_addons_ver()
+
+            # One repaint for the whole batch
+            self._request_repaint()
     
     def action_clear_marks(self) -> None:
         """Clear all marked addons"""
-        self.marked_addons.clear()
-        
-        # Refresh both tables
-        self.update_all_table()
-        self.update_installed_table()
+        self._clear_marks()
+        self._request_repaint()
     
     def action_export_list(self) -> None:
         """Export installed addon list to file"""
@@ -2343,18 +2351,28 @@ class CarapaceTUI(App):
             return
         
         # Create export file
-        from datetime import datetime
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         filename = f"carapace_addons_{timestamp}.txt"
         
+        # Sorting is cached against the addon version counter, so
+        # repeated exports in a session skip the O(N log N) pass
+        cached = getattr(self, '_export_names_cache', None)
+        if cached and cached[0] == self._all_addons_ver:
+            names = cached[1]
+        else:
+            names = [info['name'] for _, info in sorted(self.installed_addons.items())]
+            self._export_names_cache = (self._all_addons_ver, names)
+
         try:
-            with open(filename, 'w') as f:
-                f.write(f"# Carapace Addon List - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-                f.write(f"# Total: {len(self.installed_addons)} addons\n\n")
-                
-                for addon_key, addon_info in sorted(self.installed_addons.items()):
-                    f.write(f"{addon_info['name']}\n")
-            
+            lines = [
+                f"# Carapace Addon List - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+                f"# Total: {len(self.installed_addons)} addons",
+                "",
+            ]
+            lines.extend(names)
+            lines.append("")
+            Path(filename).write_text("\n".join(lines))
+
             self.notify(f"Exported addon list to {filename}")
         except Exception as e:
             self.notify(f"Failed to export: {e}", severity="error")
@@ -2362,6 +2380,7 @@ class CarapaceTUI(App):
     def action_debug_filter_urls(self) -> None:
         """Hidden debug function to filter addons with problematic URLs"""
         self.debug_url_filter = not self.debug_url_filter
+        self._bump_addons_ver()
         
         if self.debug_url_filter:
             self.notify("🔍 Debug: Showing only addons with problematic URLs", severity="warning")
@@ -2374,10 +2393,37 @@ class CarapaceTUI(App):
 
 def run_tui():
     """Run the TUI application"""
-    import os
+    from carapace.db import get_default_db_path
+    from carapace.updater import DatabaseUpdater
+
     # Set Tokyo Night theme via environment variable
     os.environ["TEXTUAL_THEME"] = "tokyo-night"
+
+    # Swap in any update staged by a previous session, before the app
+    # opens its sqlite connection and pins the live file
+    db_path = get_default_db_path()
+    if DatabaseUpdater(db_path).apply_staged_update():
+        logger.info("Applied staged database update")
+
     app = CarapaceTUI()
+
+    def _check_db_updates() -> None:
+        """Check for a newer addon database while the TUI starts up"""
+        try:
+            updater = DatabaseUpdater(db_path)
+            available, manifest = updater.check_for_updates()
+            if not (available and manifest):
+                return
+            # The live file is open in the app, so the verified download
+            # is staged and applied at the next launch
+            if updater.stage_database(manifest):
+                app.db_update_queue.put(manifest.get('version'))
+        except Exception as e:
+            logger.error(f"Background database update failed: {e}")
+
+    # Startup never blocks on the network; the app polls the queue and
+    # notifies if a fresh database was downloaded
+    threading.Thread(target=_check_db_updates, daemon=True).start()
     app.run()
 
 
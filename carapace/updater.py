@@ -8,11 +8,34 @@ import logging
 import requests
 import hashlib
 import shutil
+import socket
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional, Dict, Any
 
+from carapace.db import json_loads
+
 logger = logging.getLogger(__name__)
 
+class _BulkDownloadAdapter(requests.adapters.HTTPAdapter):
+    """HTTPAdapter tuned for large transfers
+
+    A wide receive buffer lets the kernel drain TCP into one large
+    buffer that Python consumes in far fewer recv calls; TCP_NODELAY is
+    re-stated because passing socket_options replaces urllib3's
+    defaults.
+    """
+
+    _SOCKET_OPTIONS = [
+        (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+        (socket.SOL_SOCKET, socket.SO_RCVBUF, 4 * 1024 * 1024),
+    ]
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs['socket_options'] = self._SOCKET_OPTIONS
+        super().init_poolmanager(*args, **kwargs)
+
 class DatabaseUpdater:
     """Handles checking for and downloading database updates from GitHub"""
     
@@ -20,6 +43,13 @@ class DatabaseUpdater:
     GITHUB_RAW_BASE = "https://raw.githubusercontent.com/mikl0s/Carapace/main"
     MANIFEST_URL = f"{GITHUB_RAW_BASE}/db/manifest.json"
     DATABASE_URL = f"{GITHUB_RAW_BASE}/db/carapace.db"
+
+    # Files at least this large are fetched as concurrent range requests
+    PARALLEL_STREAMS = 4
+    PARALLEL_MIN_SIZE = 8 * 1024 * 1024
+
+    # How long a completed update check suppresses the next remote fetch
+    CHECK_TTL_SECONDS = 6 * 60 * 60
     
     def __init__(self, db_path: Path):
         """
@@ -30,50 +60,147 @@ class DatabaseUpdater:
         """
         self.db_path = Path(db_path)
         self.db_dir = self.db_path.parent
+
+        # One pooled session for manifest fetch and DB download: the
+        # second request reuses the kept-alive TLS connection instead of
+        # paying another handshake, and transient 5xx responses retry
+        # with backoff
+        self.session = requests.Session()
+        retry = requests.adapters.Retry(total=3, backoff_factor=0.5, status_forcelist=[502, 503, 504])
+        adapter = _BulkDownloadAdapter(
+            pool_connections=2,
+            pool_maxsize=self.PARALLEL_STREAMS,
+            max_retries=retry
+        )
+        self.session.mount("https://", adapter)
+        self.session.headers["Accept-Encoding"] = "gzip"
         self.manifest_path = self.db_dir / "manifest.json"
-        
+        # Validators (ETag/Last-Modified) from the last manifest fetch
+        self.http_cache_path = self.db_dir / ".http_cache"
+        # mtime of this file records when the last check completed
+        self._last_check_path = self.db_dir / ".last_update_check"
+        # A staged update waits here until applied at next startup,
+        # when no sqlite connection holds the live file open
+        self.staged_path = self.db_path.with_suffix('.staged')
+        self.staged_manifest_path = self.db_dir / "manifest.json.staged"
+        # Parsed local manifest keyed by the file's mtime_ns
+        self._manifest_cache: Optional[tuple[int, Dict[str, Any]]] = None
+        # Composed database info keyed by both files' stat state
+        self._info_cache: Optional[tuple[tuple, Dict[str, Any]]] = None
+
         # Ensure db directory exists
         self.db_dir.mkdir(parents=True, exist_ok=True)
     
     def get_local_manifest(self) -> Optional[Dict[str, Any]]:
-        """Get the local manifest if it exists"""
-        if self.manifest_path.exists():
+        """Get the local manifest if it exists
+
+        The parsed manifest is cached against the file's mtime so the
+        several callers per session share one read and parse.
+        """
+        try:
+            st = self.manifest_path.stat()
+        except OSError:
+            return None
+        if self._manifest_cache and self._manifest_cache[0] == st.st_mtime_ns:
+            return self._manifest_cache[1]
+        try:
+            manifest = json_loads(self.manifest_path.read_bytes())
+        except Exception as e:
+            logger.error(f"Failed to read local manifest: {e}")
+            return None
+        self._manifest_cache = (st.st_mtime_ns, manifest)
+        return manifest
+    
+    def _load_http_cache(self) -> Dict[str, str]:
+        """Read cached HTTP validators for the manifest URL"""
+        if self.http_cache_path.exists():
             try:
-                with open(self.manifest_path, 'r') as f:
+                with open(self.http_cache_path, 'r') as f:
                     return json.load(f)
             except Exception as e:
-                logger.error(f"Failed to read local manifest: {e}")
-        return None
-    
+                logger.debug(f"Failed to read HTTP cache: {e}")
+        return {}
+
+    def _save_http_cache(self, etag: Optional[str], last_modified: Optional[str]) -> None:
+        """Persist HTTP validators so the next fetch can be conditional"""
+        try:
+            with open(self.http_cache_path, 'w') as f:
+                json.dump({'etag': etag or '', 'last_modified': last_modified or ''}, f)
+        except Exception as e:
+            logger.debug(f"Failed to save HTTP cache: {e}")
+
     def fetch_remote_manifest(self) -> Optional[Dict[str, Any]]:
-        """Fetch the manifest from GitHub"""
+        """Fetch the manifest from GitHub
+
+        Sends a conditional GET using the ETag/Last-Modified from the
+        previous fetch; a 304 means the manifest is unchanged, so the
+        local copy is returned without transferring the body.
+        """
+        headers = {}
+        cached = self._load_http_cache()
+        if cached.get('etag'):
+            headers['If-None-Match'] = cached['etag']
+        if cached.get('last_modified'):
+            headers['If-Modified-Since'] = cached['last_modified']
+
         try:
-            response = requests.get(self.MANIFEST_URL, timeout=10)
+            response = self.session.get(self.MANIFEST_URL, headers=headers, timeout=10)
+            if response.status_code == 304:
+                logger.info("Remote manifest unchanged (304)")
+                return self.get_local_manifest()
             response.raise_for_status()
-            return response.json()
+            # Parse the raw bytes directly: response.json() goes through
+            # encoding detection on the body first
+            manifest = json_loads(response.content)
+            self._save_http_cache(
+                response.headers.get('ETag'),
+                response.headers.get('Last-Modified')
+            )
+            return manifest
         except requests.exceptions.RequestException as e:
             logger.error(f"Failed to fetch remote manifest: {e}")
             return None
-        except json.JSONDecodeError as e:
+        except ValueError as e:
             logger.error(f"Invalid JSON in remote manifest: {e}")
             return None
     
-    def check_for_updates(self) -> tuple[bool, Optional[Dict[str, Any]]]:
+    def _recently_checked(self) -> bool:
+        """True if a check completed within CHECK_TTL_SECONDS"""
+        try:
+            return time.time() - self._last_check_path.stat().st_mtime < self.CHECK_TTL_SECONDS
+        except OSError:
+            return False
+
+    def check_for_updates(self, force: bool = False) -> tuple[bool, Optional[Dict[str, Any]]]:
         """
         Check if a database update is available
-        
+
+        A completed check is remembered for CHECK_TTL_SECONDS so routine
+        startups skip the network round-trip entirely; pass force=True
+        to always ask the remote.
+
+        Args:
+            force: Check the remote even if the TTL has not expired
+
         Returns:
             tuple: (update_available, remote_manifest)
         """
         # Get local manifest
         local_manifest = self.get_local_manifest()
-        
+
+        if not force and local_manifest and self.db_path.exists() and self._recently_checked():
+            logger.info("Skipping update check (checked recently)")
+            return False, None
+
         # Get remote manifest
         remote_manifest = self.fetch_remote_manifest()
         if not remote_manifest:
             logger.info("Could not fetch remote manifest")
             return False, None
-        
+
+        # Record the completed check regardless of its outcome
+        self._last_check_path.touch()
+
         # If no local manifest or database, update is needed
         if not local_manifest or not self.db_path.exists():
             logger.info("No local database found, update needed")
@@ -90,6 +217,134 @@ class DatabaseUpdater:
         logger.info(f"Database is up to date (v{local_version})")
         return False, remote_manifest
     
+    def _try_parallel_download(self, temp_path: Path) -> Optional['hashlib._Hash']:
+        """Fetch the database as concurrent byte-range requests
+
+        A single TCP stream is limited by one connection's congestion
+        window; splitting a large file into disjoint ranges, each
+        written through its own file handle, lets several streams share
+        the work. Returns the SHA-256 of the completed file, or None
+        when the server does not advertise range support or the file is
+        small, in which case the caller falls back to the single-stream
+        path.
+        """
+        try:
+            head = self.session.head(self.DATABASE_URL, allow_redirects=True, timeout=10)
+            head.raise_for_status()
+            total_size = int(head.headers.get('Content-Length') or 0)
+        except (requests.exceptions.RequestException, ValueError):
+            return None
+        if total_size < self.PARALLEL_MIN_SIZE or head.headers.get('Accept-Ranges') != 'bytes':
+            return None
+
+        logger.info(f"Downloading {total_size} bytes as {self.PARALLEL_STREAMS} range requests")
+
+        def fetch_slice(bounds) -> None:
+            lo, hi = bounds
+            response = self.session.get(
+                self.DATABASE_URL,
+                headers={'Range': f'bytes={lo}-{hi}'},
+                stream=True,
+                timeout=30
+            )
+            response.raise_for_status()
+            if response.status_code != 206:
+                raise requests.exceptions.RequestException("Server ignored Range header")
+            # One reusable buffer per slice; byte ranges are served
+            # identity-encoded so the raw stream is read directly.
+            # Each slice writes through its own handle (os.pwrite does
+            # not exist on Windows); disjoint ranges need no locking
+            buf = bytearray(1024 * 1024)
+            mv = memoryview(buf)
+            offset = lo
+            with open(temp_path, 'r+b') as f:
+                f.seek(lo)
+                while True:
+                    n = response.raw.readinto(buf)
+                    if not n:
+                        break
+                    f.write(mv[:n])
+                    offset += n
+            if offset != hi + 1:
+                raise requests.exceptions.RequestException(f"Slice ended at {offset}, expected {hi + 1}")
+
+        slice_size = -(-total_size // self.PARALLEL_STREAMS)
+        slices = [(lo, min(lo + slice_size, total_size) - 1)
+                  for lo in range(0, total_size, slice_size)]
+
+        ok = False
+        try:
+            # Pre-size the file so every slice has its region in place
+            with open(temp_path, 'wb') as f:
+                f.truncate(total_size)
+            with ThreadPoolExecutor(max_workers=len(slices)) as executor:
+                # list() re-raises the first slice failure
+                list(executor.map(fetch_slice, slices))
+            # Durable before the rename that publishes it
+            with open(temp_path, 'r+b') as f:
+                os.fsync(f.fileno())
+            ok = True
+        except Exception as e:
+            logger.warning(f"Parallel download failed, falling back to single stream: {e}")
+        if not ok:
+            temp_path.unlink(missing_ok=True)
+            return None
+
+        # Slices land out of order, so hash the finished file in one
+        # pass; file_digest reads through a reusable buffer straight
+        # into OpenSSL without intermediate bytes objects
+        with open(temp_path, 'rb') as f:
+            file_hash = hashlib.file_digest(f, 'sha256')
+        return file_hash
+
+    def _download_single_stream(self, temp_path: Path) -> 'hashlib._Hash':
+        """Download the database over one stream, resuming any partial file
+
+        Sends Range: bytes=N- for the size of an existing temp file so a
+        retry only transfers the remaining bytes. Hashes each chunk as it
+        arrives, so the file never has to be re-read for verification.
+        """
+        resume_from = temp_path.stat().st_size if temp_path.exists() else 0
+        headers = {'Range': f'bytes={resume_from}-'} if resume_from else {}
+        response = self.session.get(self.DATABASE_URL, headers=headers, stream=True, timeout=30)
+        if resume_from and response.status_code == 416:
+            # Partial file is stale or oversized; start over
+            temp_path.unlink()
+            resume_from = 0
+            response = self.session.get(self.DATABASE_URL, stream=True, timeout=30)
+        response.raise_for_status()
+
+        if resume_from and response.status_code == 206:
+            # Server honoured the range: seed the hash with the bytes
+            # already on disk, then append the remainder. file_digest
+            # returns a live hash object that keeps accepting updates
+            logger.info(f"Resuming download from byte {resume_from}")
+            mode = 'ab'
+            with open(temp_path, 'rb') as f:
+                file_hash = hashlib.file_digest(f, 'sha256')
+        else:
+            file_hash = hashlib.sha256()
+            # 200 OK: server sent the full file, overwrite any partial
+            mode = 'wb'
+
+        # Read into one reusable buffer instead of letting iter_content
+        # allocate a fresh bytes object per chunk — one allocation for
+        # the whole download instead of one per megabyte
+        response.raw.decode_content = True
+        buf = bytearray(1024 * 1024)
+        mv = memoryview(buf)
+        with open(temp_path, mode) as f:
+            while True:
+                n = response.raw.readinto(buf)
+                if not n:
+                    break
+                f.write(mv[:n])
+                file_hash.update(mv[:n])
+            # Durable before the rename that publishes it
+            f.flush()
+            os.fsync(f.fileno())
+        return file_hash
+
     def download_database(self, expected_checksum: str = None) -> bool:
         """
         Download the database from GitHub
@@ -101,58 +356,130 @@ class DatabaseUpdater:
             bool: True if download successful
         """
         try:
-            # Download to temporary file
-            temp_path = self.db_path.with_suffix('.tmp')
-            
-            logger.info(f"Downloading database from {self.DATABASE_URL}")
-            response = requests.get(self.DATABASE_URL, stream=True, timeout=30)
-            response.raise_for_status()
-            
-            # Write to temp file
-            with open(temp_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    if chunk:
-                        f.write(chunk)
-            
-            # Verify checksum if provided
-            if expected_checksum:
-                with open(temp_path, 'rb') as f:
-                    file_hash = hashlib.sha256(f.read()).hexdigest()
-                
-                if file_hash != expected_checksum:
-                    logger.error(f"Checksum mismatch! Expected: {expected_checksum}, Got: {file_hash}")
-                    temp_path.unlink()
-                    return False
-                
-                logger.info("Checksum verified successfully")
-            
-            # Backup existing database if it exists
-            if self.db_path.exists():
-                backup_path = self.db_path.with_suffix('.backup')
-                shutil.copy2(self.db_path, backup_path)
-                logger.info(f"Backed up existing database to {backup_path}")
-            
-            # Move temp file to final location
-            shutil.move(str(temp_path), str(self.db_path))
+            temp_path = self._download_verified(expected_checksum)
+            if temp_path is None:
+                return False
+
+            self._backup_current()
+
+            # Atomic rename onto the final location; same-filesystem by
+            # construction since the temp file lives next to the target
+            os.replace(temp_path, self.db_path)
             logger.info(f"Database downloaded successfully to {self.db_path}")
             return True
-            
+
         except requests.exceptions.RequestException as e:
             logger.error(f"Failed to download database: {e}")
             return False
         except Exception as e:
             logger.error(f"Unexpected error downloading database: {e}")
             return False
+
+    def _download_verified(self, expected_checksum: Optional[str]) -> Optional[Path]:
+        """Download to a temp file and verify it; returns the temp path"""
+        # Download to temporary file
+        temp_path = self.db_path.with_suffix('.tmp')
+
+        logger.info(f"Downloading database from {self.DATABASE_URL}")
+
+        # Large files go faster as several concurrent range requests;
+        # fall back to a single resumable stream if the server does
+        # not support ranges or the file is small
+        file_hash = None
+        if not temp_path.exists():
+            file_hash = self._try_parallel_download(temp_path)
+        if file_hash is None:
+            file_hash = self._download_single_stream(temp_path)
+
+        # Verify checksum if provided
+        if expected_checksum:
+            file_hash = file_hash.hexdigest()
+            if file_hash != expected_checksum:
+                logger.error(f"Checksum mismatch! Expected: {expected_checksum}, Got: {file_hash}")
+                temp_path.unlink()
+                return None
+
+            logger.info("Checksum verified successfully")
+
+        return temp_path
+
+    def _backup_current(self) -> None:
+        """Back up the live database next to itself
+
+        A hard link is an instant inode-level backup; fall back to a
+        copy on filesystems without link support.
+        """
+        if not self.db_path.exists():
+            return
+        backup_path = self.db_path.with_suffix('.backup')
+        try:
+            backup_path.unlink(missing_ok=True)
+            os.link(self.db_path, backup_path)
+        except OSError:
+            shutil.copy2(self.db_path, backup_path)
+        logger.info(f"Backed up existing database to {backup_path}")
+
+    def stage_database(self, remote_manifest: Dict[str, Any]) -> bool:
+        """Download an update and park it for the next startup
+
+        While the app runs, its sqlite connection keeps the live file
+        open, and on Windows the rename onto it fails. The verified
+        download and its manifest are staged next to the live files
+        instead; apply_staged_update swaps them in at the next launch
+        before any connection exists.
+
+        Returns:
+            bool: True if an update was staged
+        """
+        try:
+            temp_path = self._download_verified(remote_manifest.get('checksum'))
+            if temp_path is None:
+                return False
+            with open(self.staged_manifest_path, 'w') as f:
+                json.dump(remote_manifest, f, indent=2)
+            os.replace(temp_path, self.staged_path)
+            logger.info(f"Staged database update at {self.staged_path}")
+            return True
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Failed to stage database update: {e}")
+            return False
+        except Exception as e:
+            logger.error(f"Unexpected error staging database update: {e}")
+            return False
+
+    def apply_staged_update(self) -> bool:
+        """Swap a staged update into place
+
+        Must run before any sqlite connection to the database is
+        opened. Returns True if a staged update was applied.
+        """
+        if not self.staged_path.exists():
+            return False
+        try:
+            self._backup_current()
+            os.replace(self.staged_path, self.db_path)
+            if self.staged_manifest_path.exists():
+                os.replace(self.staged_manifest_path, self.manifest_path)
+            logger.info(f"Applied staged database update to {self.db_path}")
+            return True
+        except OSError as e:
+            logger.error(f"Failed to apply staged database update: {e}")
+            return False
     
-    def update_database(self) -> bool:
+    def update_database(self, force: bool = False) -> bool:
         """
         Check for and apply database updates
-        
+
+        Args:
+            force: Check the remote even if the TTL has not expired;
+                a prior check touches the TTL marker, which would
+                otherwise short-circuit this one
+
         Returns:
             bool: True if database was updated or is already up to date
         """
-        update_available, remote_manifest = self.check_for_updates()
-        
+        update_available, remote_manifest = self.check_for_updates(force=force)
+
         if not update_available:
             return True
         
@@ -176,14 +503,29 @@ class DatabaseUpdater:
             return False
     
     def get_database_info(self) -> Dict[str, Any]:
-        """Get information about the current database"""
+        """Get information about the current database
+
+        The composed dict is cached against both files' stat state, so
+        repeated status polls cost two stat calls and return the same
+        object instead of re-parsing the manifest.
+        """
+        try:
+            manifest_mtime = self.manifest_path.stat().st_mtime_ns
+        except OSError:
+            manifest_mtime = None
+        db_exists = self.db_path.exists()
+
+        cache_key = (db_exists, manifest_mtime)
+        if self._info_cache and self._info_cache[0] == cache_key:
+            return self._info_cache[1]
+
         info = {
-            'exists': self.db_path.exists(),
+            'exists': db_exists,
             'path': str(self.db_path),
-            'manifest_exists': self.manifest_path.exists()
+            'manifest_exists': manifest_mtime is not None
         }
-        
-        if self.manifest_path.exists():
+
+        if manifest_mtime is not None:
             manifest = self.get_local_manifest()
             if manifest:
                 info.update({
@@ -192,7 +534,8 @@ class DatabaseUpdater:
                     'updated': manifest.get('updated'),
                     'wiki_revision': manifest.get('wiki_revision')
                 })
-        
+
+        self._info_cache = (cache_key, info)
         return info
 
 
@@ -219,5 +562,7 @@ def check_and_update_database(db_path: Path, force: bool = False) -> bool:
                     json.dump(remote_manifest, f, indent=2)
                 return True
         return False
-    
-    return updater.update_database()
\ No newline at end of file
+
+    # An explicit update request bypasses the check TTL: a recent
+    # background check must not turn this call into a silent no-op
+    return updater.update_database(force=True)
\ No newline at end of file